@@ -0,0 +1,132 @@
+"""
+Benchmark de respostas via Evolution sob carga sintética (padrão: 100 msg/s).
+
+Sobe um servidor HTTP mínimo (asyncio puro) no lugar da Evolution API, que
+conta os sockets abertos, e compara:
+  - antes:  um `EvolutionClient()` novo por mensagem (comportamento antigo);
+  - depois: o cliente compartilhado injetado por `process_evolution_message`.
+
+Uso:
+    PYTHONPATH=src python benchmarks/evolution_client.py [msgs_por_s] [segundos]
+"""
+
+import asyncio
+import os
+import statistics
+import sys
+import time
+
+PORT = 5080
+os.environ["EVOLUTION_URL"] = f"http://127.0.0.1:{PORT}"
+os.environ.setdefault("EVOLUTION_TOKEN", "bench")
+
+from loguru import logger  # noqa: E402
+
+from app.kernel.infrastructure.providers.evolution import (  # noqa: E402
+    EvolutionWebhook,
+    process_evolution_message,
+)
+from app.kernel.infrastructure.providers.evolution.client import (  # noqa: E402
+    EvolutionClient,
+    evolution_client,
+)
+
+RESPONSE = b'{"key": {"id": "BENCH"}}'
+
+
+class FakeEvolution:
+    def __init__(self):
+        self.opened = 0
+        self.open_now = 0
+        self.max_open = 0
+
+    async def handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        self.opened += 1
+        self.open_now += 1
+        self.max_open = max(self.max_open, self.open_now)
+        try:
+            while True:
+                head = await reader.readuntil(b"\r\n\r\n")
+                length = 0
+                for line in head.split(b"\r\n"):
+                    if line.lower().startswith(b"content-length:"):
+                        length = int(line.split(b":", 1)[1])
+                await reader.readexactly(length)
+                writer.write(
+                    b"HTTP/1.1 200 OK\r\nContent-Type: application/json\r\n"
+                    b"Content-Length: %d\r\n\r\n%s" % (len(RESPONSE), RESPONSE)
+                )
+                await writer.drain()
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            self.open_now -= 1
+            writer.close()
+
+
+def webhook(i: int) -> EvolutionWebhook:
+    return EvolutionWebhook.model_validate(
+        {
+            "event": "messages.upsert",
+            "instance": "DGN-BOT",
+            "apikey": "bench",
+            "data": {
+                "key": {
+                    "remoteJid": f"55{i}@s.whatsapp.net",
+                    "fromMe": False,
+                    "id": f"ID{i}",
+                },
+                "pushName": "Bench",
+                "messageType": "conversation",
+                "message": {"conversation": "oi"},
+            },
+        }
+    )
+
+
+async def run(label: str, per_client: bool, rate: int, seconds: int) -> None:
+    server_state = FakeEvolution()
+    server = await asyncio.start_server(server_state.handle, "127.0.0.1", PORT)
+    latencies = []
+    clients = []
+
+    async def reply(i: int) -> None:
+        message = process_evolution_message(webhook(i))
+        if per_client:
+            message.client = EvolutionClient()
+            clients.append(message.client)
+        started = time.perf_counter()
+        response = await message.reply_text("pong")
+        if response.status == "success":
+            latencies.append(time.perf_counter() - started)
+
+    tasks = []
+    for i in range(rate * seconds):
+        tasks.append(asyncio.create_task(reply(i)))
+        await asyncio.sleep(1 / rate)
+    await asyncio.gather(*tasks)
+
+    for client in clients + [evolution_client]:
+        await client.close()
+    server.close()
+    await server.wait_closed()
+
+    latencies.sort()
+    p95 = latencies[int(len(latencies) * 0.95) - 1] if latencies else 0
+    print(
+        f"{label:<8} ok={len(latencies):>5}  "
+        f"p50={statistics.median(latencies) * 1000:>7.2f}ms  p95={p95 * 1000:>7.2f}ms  "
+        f"sockets abertos={server_state.opened:>5}  simultâneos(max)={server_state.max_open:>4}"
+    )
+
+
+async def main(rate: int, seconds: int) -> None:
+    await run("antes", True, rate, seconds)
+    await run("depois", False, rate, seconds)
+
+
+if __name__ == "__main__":
+    logger.remove()
+    rate = int(sys.argv[1]) if len(sys.argv) > 1 else 100
+    seconds = int(sys.argv[2]) if len(sys.argv) > 2 else 10
+    asyncio.run(main(rate, seconds))
@@ -0,0 +1,163 @@
+"""
+Benchmark do POST /sync/transactions/batch com 10k e 100k transações.
+
+Compara a implementação antiga (um SELECT da conta e um `db.get` por item)
+com o upsert em lote de `sync_batch_transactions`, contando os statements
+enviados ao Postgres. Usa o banco configurado em POSTGRES_* (as tabelas são
+criadas se preciso); as linhas do benchmark são removidas ao final.
+
+Uso:
+    PYTHONPATH=src python benchmarks/finance_sync_batch.py [n ...] [--skip-legacy-above N]
+"""
+
+import asyncio
+import sys
+import time
+import uuid
+from typing import List
+
+from loguru import logger
+from sqlalchemy import delete, event, select
+
+from app.modules.finances.database import Base, client
+from app.modules.finances.database.models import Account, Transaction
+from app.modules.finances.web.finance_api import sync_batch_transactions
+
+# Acima deste tamanho o caminho antigo leva minutos; pode ser alterado por flag.
+LEGACY_LIMIT = 10_000
+
+
+async def legacy_sync(payload: List[dict], db) -> dict:
+    """Cópia do caminho antigo, linha a linha pelo ORM."""
+    results = []
+    for data in payload:
+        tx_id = data.get("id")
+        local_account_id = data.get("account_id")
+        acc_result = await db.execute(
+            select(Account).where(Account.local_id == local_account_id)
+        )
+        account = acc_result.scalar_one_or_none()
+        if not account:
+            results.append(
+                {"id": tx_id, "error": f"Account {local_account_id} not found"}
+            )
+            continue
+
+        transaction = await db.get(Transaction, tx_id)
+        if not transaction:
+            transaction = Transaction(
+                id=tx_id,
+                entity=data.get("entity", ""),
+                description=data.get("description", ""),
+                amount_cents=data.get("amount_cents", 0),
+                date_timestamp=data.get("date_timestamp", 0),
+                account_id=account.id,
+                category_id=data.get("category_id"),
+                is_deleted=data.get("is_deleted", False),
+                importation_id=data.get("importation_id", "cloud_sync"),
+                import_timestamp=data.get("import_timestamp", int(time.time())),
+            )
+            db.add(transaction)
+        else:
+            transaction.entity = data.get("entity", transaction.entity)
+            transaction.description = data.get("description", transaction.description)
+            transaction.amount_cents = data.get(
+                "amount_cents", transaction.amount_cents
+            )
+            transaction.category_id = data.get("category_id")
+            transaction.is_deleted = data.get("is_deleted", transaction.is_deleted)
+            transaction.importation_id = data.get(
+                "importation_id", transaction.importation_id
+            )
+            transaction.import_timestamp = data.get(
+                "import_timestamp", transaction.import_timestamp
+            )
+        results.append({"local_id": tx_id, "server_id": transaction.id})
+    await db.commit()
+    return {"results": results}
+
+
+def make_payload(n: int, prefix: str, local_account_id: str) -> List[dict]:
+    now = int(time.time())
+    return [
+        {
+            "id": f"{prefix}-{i}",
+            "account_id": local_account_id,
+            "entity": f"Loja {i % 50}",
+            "description": "benchmark",
+            "amount_cents": -(i % 10_000),
+            "date_timestamp": now - i * 60,
+            "is_deleted": False,
+            "importation_id": "bench",
+            "import_timestamp": now,
+        }
+        for i in range(n)
+    ]
+
+
+async def measure(label: str, sync, payload: List[dict], counter: dict) -> None:
+    # Primeira passada insere tudo; a segunda atualiza as mesmas linhas.
+    for phase in ("insert", "update"):
+        counter["statements"] = 0
+        async with client.session_factory() as db:
+            started = time.perf_counter()
+            result = await sync(payload, db)
+            elapsed = time.perf_counter() - started
+        ok = sum(1 for item in result["results"] if "server_id" in item)
+        print(
+            f"{label:<7} {phase:<6} n={len(payload):>7}  ok={ok:>7}  "
+            f"{elapsed:>8.2f}s  {len(payload) / elapsed:>9.0f} tx/s  "
+            f"statements={counter['statements']:>7}"
+        )
+
+
+async def main(sizes: List[int], legacy_limit: int) -> None:
+    await client.setup_database(Base.metadata)
+    counter = {"statements": 0}
+
+    @event.listens_for(client.engine.sync_engine, "before_cursor_execute")
+    def count(*args):
+        counter["statements"] += 1
+
+    local_account_id = f"bench-{uuid.uuid4().hex[:8]}"
+    async with client.session_factory() as db:
+        account = Account(
+            name="Benchmark", initial_balance_cents=0, local_id=local_account_id
+        )
+        db.add(account)
+        await db.commit()
+        account_id = account.id
+
+    try:
+        for n in sizes:
+            if n <= legacy_limit:
+                payload = make_payload(
+                    n, f"{local_account_id}-old{n}", local_account_id
+                )
+                await measure("antes", legacy_sync, payload, counter)
+            payload = make_payload(n, f"{local_account_id}-new{n}", local_account_id)
+
+            async def bulk(payload, db):
+                return await sync_batch_transactions(payload, user=None, db=db)
+
+            await measure("depois", bulk, payload, counter)
+    finally:
+        async with client.session_factory() as db:
+            await db.execute(
+                delete(Transaction).where(Transaction.account_id == account_id)
+            )
+            await db.execute(delete(Account).where(Account.id == account_id))
+            await db.commit()
+        await client.engine.dispose()
+
+
+if __name__ == "__main__":
+    logger.remove()
+    args = sys.argv[1:]
+    legacy_limit = LEGACY_LIMIT
+    if "--skip-legacy-above" in args:
+        index = args.index("--skip-legacy-above")
+        legacy_limit = int(args[index + 1])
+        del args[index : index + 2]
+    sizes = [int(arg) for arg in args] or [10_000, 100_000]
+    asyncio.run(main(sizes, legacy_limit))
@@ -0,0 +1,82 @@
+"""
+Benchmark da latência por operação do StorageService.
+
+Compara um cliente S3 novo por chamada (comportamento antigo, ainda usado fora
+do lifespan) com o cliente compartilhado aberto no `setup()`.
+Sem BUCKET_ENDPOINT definido, sobe um servidor moto local como stand-in do
+MinIO (`pip install "moto[server]"`).
+
+Uso:
+    PYTHONPATH=src python benchmarks/storage_client.py [N]
+"""
+
+import asyncio
+import logging
+import os
+import statistics
+import sys
+import time
+
+os.environ.setdefault("EVOLUTION_URL", "http://localhost:8080")
+os.environ.setdefault("EVOLUTION_TOKEN", "bench")
+
+server = None
+if not os.environ.get("BUCKET_ENDPOINT"):
+    from moto.server import ThreadedMotoServer
+
+    logging.getLogger("werkzeug").setLevel(logging.ERROR)
+    server = ThreadedMotoServer(ip_address="127.0.0.1", port=5055, verbose=False)
+    server.start()
+    os.environ["BUCKET_ENDPOINT"] = "http://127.0.0.1:5055"
+    os.environ.setdefault("BUCKET_ACCESS_KEY", "bench")
+    os.environ.setdefault("BUCKET_SECRET_KEY", "bench")
+    os.environ.setdefault("BUCKET_NAME", "bench-bucket")
+
+from app.kernel.infrastructure.services.storage import StorageService  # noqa: E402
+
+KEY = "bench/object.txt"
+
+
+async def measure(storage: StorageService, n: int) -> dict:
+    timings = {"upload_file": [], "get_item_content": [], "list_all_files": []}
+    for i in range(n):
+        started = time.perf_counter()
+        await storage.upload_file(KEY, f"payload {i}".encode(), "text/plain")
+        timings["upload_file"].append(time.perf_counter() - started)
+
+        started = time.perf_counter()
+        await storage.get_item_content(KEY)
+        timings["get_item_content"].append(time.perf_counter() - started)
+
+        started = time.perf_counter()
+        await storage.list_all_files("bench")
+        timings["list_all_files"].append(time.perf_counter() - started)
+    return {op: statistics.median(values) * 1000 for op, values in timings.items()}
+
+
+async def main(n: int) -> None:
+    storage = StorageService()
+
+    # Garante o bucket e mede o cliente por chamada antes de abrir o compartilhado.
+    await storage.setup()
+    await storage.close()
+    before = await measure(storage, n)
+
+    await storage.setup()
+    after = await measure(storage, n)
+    await storage.close()
+
+    print(f"{'operação':<18} {'antes (ms)':>12} {'depois (ms)':>12} {'speedup':>9}")
+    for op in before:
+        print(
+            f"{op:<18} {before[op]:>12.2f} {after[op]:>12.2f} "
+            f"{before[op] / after[op]:>8.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    try:
+        asyncio.run(main(int(sys.argv[1]) if len(sys.argv) > 1 else 50))
+    finally:
+        if server:
+            server.stop()
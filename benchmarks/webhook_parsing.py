@@ -0,0 +1,100 @@
+"""
+Benchmark do parsing de webhooks da Evolution (webhooks/s).
+
+Compara o caminho antigo (validação Pydantic completa de todo payload + cópia
+do dict `message`) com o fast-path (`loads_webhook` + `peek_webhook`, que só
+valida o modelo completo para mensagens que algum módulo vai tratar).
+
+Uso:
+    PYTHONPATH=src python benchmarks/webhook_parsing.py [N]
+"""
+
+import json
+import os
+import random
+import sys
+import time
+
+os.environ.setdefault("EVOLUTION_URL", "http://localhost:8080")
+os.environ.setdefault("EVOLUTION_TOKEN", "bench")
+
+from app.kernel.infrastructure.providers.evolution import (  # noqa: E402
+    EvolutionWebhook,
+    loads_webhook,
+    peek_webhook,
+)
+
+
+def _payload(kind: str, i: int) -> dict:
+    base = {
+        "event": "messages.upsert",
+        "instance": "DGN-BOT",
+        "apikey": "token",
+        "data": {
+            "key": {
+                "remoteJid": f"55{i}@s.whatsapp.net",
+                "fromMe": False,
+                "id": f"ID{i}",
+            },
+            "pushName": "Bench",
+            "messageTimestamp": 1700000000,
+            "messageType": "conversation",
+            "message": {"conversation": "mensagem de teste " * 5},
+        },
+    }
+    if kind == "from_me":
+        base["data"]["key"]["fromMe"] = True
+    elif kind == "status":
+        base["event"] = "messages.update"
+        base["data"] = {"status": "READ", "keyId": f"ID{i}"}
+    elif kind == "unsupported":
+        base["data"]["messageType"] = "reactionMessage"
+        base["data"]["message"] = {"reactionMessage": {"text": "👍"}}
+    elif kind == "sticker":
+        base["data"]["messageType"] = "stickerMessage"
+        base["data"]["message"] = {
+            "stickerMessage": {"fileSha256": "abc=", "mimetype": "image/webp"},
+            "mediaUrl": "http://minio/evolution-api/sticker.webp",
+        }
+    return base
+
+
+def build_corpus(n: int) -> list[bytes]:
+    kinds = ["text"] * 4 + ["sticker"] + ["from_me"] * 3 + ["status"] + ["unsupported"]
+    rng = random.Random(42)
+    return [json.dumps(_payload(rng.choice(kinds), i)).encode() for i in range(n)]
+
+
+def baseline(body: bytes) -> None:
+    # Equivalente ao que o FastAPI fazia com `payload: EvolutionWebhook`.
+    try:
+        payload = EvolutionWebhook.model_validate(json.loads(body))
+    except Exception:
+        return
+    _ = {**(payload.data.message or {}), "messageType": payload.data.message_type}
+
+
+def fast_path(body: bytes) -> None:
+    raw = loads_webhook(body)
+    if peek_webhook(raw) is None:
+        return
+    payload = EvolutionWebhook.model_validate(raw)
+    _ = payload.data.message or {}
+
+
+def run(label: str, fn, corpus: list[bytes]) -> float:
+    started = time.perf_counter()
+    for body in corpus:
+        fn(body)
+    elapsed = time.perf_counter() - started
+    rate = len(corpus) / elapsed
+    print(f"{label:<10} {rate:>12,.0f} webhooks/s")
+    return rate
+
+
+if __name__ == "__main__":
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    corpus = build_corpus(n)
+    before = run("antes", baseline, corpus)
+    after = run("depois", fast_path, corpus)
+    print(f"speedup    {after / before:>12.2f}x")
@@ -7,15 +7,29 @@ to the rest of the application.
 # 1. Core & Interfaces
 from .core import (
     response_registry,
+    metrics_registry,
     MessageData,
     ChatClient,
     ChatResponse,
     MessageType,
     BaseModule,
+    message_dispatcher,
 )
 
 # 2. Infrastructure Services (Instantiated)
-from .infrastructure import storage_service, translate_service, external_api
+from .infrastructure import (
+    storage_service,
+    translate_service,
+    external_api,
+    media_client,
+    dataset_cache,
+    phash_cache,
+    asset_cache,
+    asset_pipeline,
+    presigned_urls,
+    image_hasher,
+    webhook_deduplicator,
+)
 
 # 3. Database Factory
 from .infrastructure.database.postgres_client import PostgresClient
@@ -25,9 +39,13 @@ from .utils import (
     setup_logging,
     calculate_phash,
     get_hash_from_b64,
+    get_hash_from_bytes,
     url_to_b64,
+    url_to_bytes,
     setup_views,
     add_uuid_to_filename,
+    LRUCache,
+    pattern_registry,
 )
 
 # 5. Global Config
@@ -39,23 +57,37 @@ from .config import settings
 __all__ = [
     # Core
     "response_registry",
+    "metrics_registry",
     "MessageData",
     "ChatClient",
     "ChatResponse",
     "MessageType",
     "BaseModule",
+    "message_dispatcher",
     # Infrastructure
     "storage_service",
     "translate_service",
     "external_api",
+    "media_client",
+    "dataset_cache",
+    "phash_cache",
+    "asset_cache",
+    "asset_pipeline",
+    "presigned_urls",
+    "image_hasher",
+    "webhook_deduplicator",
     "PostgresClient",
     # Utilities
     "setup_logging",
     "calculate_phash",
     "get_hash_from_b64",
+    "get_hash_from_bytes",
     "url_to_b64",
+    "url_to_bytes",
     "setup_views",
     "add_uuid_to_filename",
+    "LRUCache",
+    "pattern_registry",
     # Config
     "settings",
 ]
@@ -1,6 +1,8 @@
 from fastapi import APIRouter
 from .webhooks import router as webhooks_router
+from .metrics import router as metrics_router
 
 router = APIRouter()
 router.include_router(webhooks_router)
+router.include_router(metrics_router)
 __all__ = ["router"]
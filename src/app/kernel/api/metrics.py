@@ -0,0 +1,9 @@
+from fastapi import APIRouter
+from app.kernel.core.registry import metrics_registry
+
+router = APIRouter(prefix="/metrics", tags=["Metrics"])
+
+
+@router.get("")
+async def get_metrics():
+    return metrics_registry.snapshot()
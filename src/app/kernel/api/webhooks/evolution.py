@@ -1,7 +1,12 @@
-from fastapi import APIRouter, BackgroundTasks
-from app.kernel.core.registry import module_registry
+from fastapi import APIRouter, HTTPException, Request
+from fastapi.exceptions import RequestValidationError
+from pydantic import ValidationError
+from app.kernel.core import message_dispatcher, module_registry
+from app.kernel.infrastructure import webhook_deduplicator
 from app.kernel.infrastructure.providers.evolution import (
     EvolutionWebhook,
+    loads_webhook,
+    peek_webhook,
     process_evolution_message,
 )
 
@@ -9,12 +14,32 @@ router = APIRouter(prefix="/evolution", tags=["Evolution Webhooks"])
 
 
 @router.post("")
-async def handle_evolution(
-    payload: EvolutionWebhook, background_tasks: BackgroundTasks
-):
+async def handle_evolution(request: Request):
+    try:
+        raw = loads_webhook(await request.body())
+    except ValueError:
+        raise HTTPException(status_code=400, detail="JSON inválido")
+
+    peek = peek_webhook(raw)
+    if not peek or not any(
+        module.accepts(peek.message_type) for module in module_registry.get_all()
+    ):
+        return {"status": "ignored"}
+
+    if await webhook_deduplicator.is_duplicate(peek.instance, peek.message_id):
+        return {"status": "duplicate"}
+
+    try:
+        payload = EvolutionWebhook.model_validate(raw)
+    except ValidationError as e:
+        # Uma retentativa corrigida não pode ser tratada como duplicada.
+        await webhook_deduplicator.forget(peek.instance, peek.message_id)
+        raise RequestValidationError(e.errors())
+
     message_data = process_evolution_message(payload)
     if not message_data:
         return {"status": "ignored"}
-    for module in module_registry.get_all():
-        background_tasks.add_task(module.handle_message, message_data)
+    if not message_dispatcher.submit(message_data):
+        await webhook_deduplicator.forget(peek.instance, peek.message_id)
+        return {"status": "dropped"}
     return {"status": "ok"}
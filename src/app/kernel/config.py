@@ -1,3 +1,4 @@
+from pydantic import Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
 from typing import Optional
 from dotenv import load_dotenv
@@ -20,6 +21,10 @@ class Settings(BaseSettings):
     TRANSLATE_API_KEY: Optional[str] = None
     TRANSLATE_TIMEOUT: int = 10
     TRANSLATE_TARGET_LANG: str = "pb"
+    TRANSLATE_CACHE_SIZE: int = 5000
+    TRANSLATE_CACHE_PERSIST: bool = True
+    TRANSLATE_BATCH_WINDOW_MS: float = 5.0  # 0 desativa o micro-batching
+    TRANSLATE_BATCH_MAX: int = 32
 
     # --- BUCKET CONFIG ---
     BUCKET_ENDPOINT: str = ""
@@ -27,6 +32,10 @@ class Settings(BaseSettings):
     BUCKET_SECRET_KEY: str = ""
     BUCKET_NAME: str = "dragon-bot-bucket"
     BUCKET_REGION: str = "us-east-1"
+    BUCKET_PRIVATE: bool = False
+    PRESIGNED_URL_TTL: int = 6 * 3600
+    PRESIGNED_URL_REFRESH: int = 15 * 60
+    PRESIGNED_URL_CACHE_SIZE: int = 10_000
 
     # --- EVOLUTION API ---
     EVOLUTION_URL: str
@@ -38,10 +47,59 @@ class Settings(BaseSettings):
     EVOLUTION_WEBHOOK_BASE64: bool = False
     EVOLUTION_WEBHOOK_EVENTS: str = "MESSAGES_UPSERT"
 
+    # --- OUTBOUND ---
+    OUTBOUND_ENABLED: bool = True
+    OUTBOUND_RATE: float = Field(20.0, gt=0)  # envios/s somando todos os chats
+    OUTBOUND_BURST: int = Field(5, ge=1)
+    OUTBOUND_COALESCE_WINDOW_MS: float = 0  # 0 desativa o agrupamento de textos
+
     # --- SYNC CONFIG ---
     SYNC_API_URL: str = "http://localhost:8001"
 
     SETTINGS_PATH: str = "config"
 
+    # --- MESSAGE DISPATCH ---
+    DISPATCH_WORKERS: int = 8
+    DISPATCH_MAX_QUEUE: int = 100
+    DISPATCH_SHED_POLICY: str = "drop_oldest"  # drop_oldest | drop_newest
+
+    # --- WEBHOOK DEDUPE ---
+    DEDUPE_TTL: int = 600
+    DEDUPE_MAX_SIZE: int = 50_000
+    DEDUPE_REDIS_URL: Optional[str] = None
+
+    # --- MEDIA DOWNLOAD ---
+    MEDIA_MAX_BYTES: int = 10 * 1024 * 1024
+    MEDIA_TIMEOUT: int = 10
+    MEDIA_MAX_CONCURRENT: int = 20
+
+    # --- MEDIA BLOBS (figurinhas/áudios já codificados para a Evolution) ---
+    MEDIA_BLOB_CACHE_ENABLED: bool = True
+    MEDIA_BLOB_CACHE_SIZE: int = 128
+    MEDIA_BLOB_CACHE_TTL: int = 6 * 3600
+    MEDIA_BLOB_MAX_BYTES: int = 1024 * 1024
+    MEDIA_BLOB_FALLBACK_TTL: int = 3600
+
+    # --- IMAGE HASHING ---
+    IMAGE_HASH_EXECUTOR: str = "process"  # process | thread
+    IMAGE_HASH_WORKERS: int = 2
+    IMAGE_HASH_MAX_PENDING: int = 32
+    IMAGE_HASH_QUEUE_TIMEOUT: float = 2.0
+
+    # --- CACHES ---
+    REGEX_CACHE_SIZE: int = 1024
+    PHASH_CACHE_SIZE: int = 50_000
+    PHASH_CACHE_TTL: int = 7 * 24 * 3600
+    PHASH_CACHE_PERSIST: bool = True
+    ASSET_CACHE_ENABLED: bool = True
+    DATASET_REFRESH_INTERVAL: int = 6 * 3600
+
+    # --- STORAGE ---
+    STORAGE_MAX_POOL_CONNECTIONS: int = 32
+    STORAGE_MULTIPART_THRESHOLD: int = 8 * 1024 * 1024  # também o tamanho da parte
+    STORAGE_MULTIPART_CONCURRENCY: int = 4
+    STORAGE_PREFETCH_CONCURRENCY: int = 16
+    ASSET_TRANSCODE_MAX_BYTES: int = 20 * 1024 * 1024
+
 
 settings = Settings()
@@ -1,6 +1,7 @@
-from .registry import response_registry, module_registry
+from .registry import response_registry, module_registry, metrics_registry
 from .logic import response_impl
 from .module import BaseModule
+from .dispatcher import message_dispatcher
 from .interfaces import (
     MessageData,
     ChatResponse,
@@ -12,8 +13,10 @@ from .interfaces import (
 
 __all__ = [
     "BaseModule",
+    "message_dispatcher",
     "response_registry",
     "module_registry",
+    "metrics_registry",
     "MessageData",
     "ChatResponse",
     "ChatClient",
@@ -0,0 +1,147 @@
+import asyncio
+import time
+import zlib
+from typing import Any, Dict, List, Tuple
+
+from loguru import logger
+
+from app.kernel.config import settings
+from .interfaces import MessageData, MessageType
+from .registry import module_registry, metrics_registry
+
+SHED_POLICIES = ("drop_newest", "drop_oldest")
+
+QueueItem = Tuple[float, MessageData]
+
+
+class MessageDispatcher:
+    """
+    Pipeline assíncrono de processamento de mensagens.
+    Cada chat (`MessageData.number`) cai sempre no mesmo shard, e cada shard é
+    consumido por um único worker, preservando a ordem das respostas por chat.
+    """
+
+    def __init__(self, workers: int, max_queue: int, shed_policy: str):
+        if shed_policy not in SHED_POLICIES:
+            raise ValueError(f"Política de descarte inválida: {shed_policy}")
+
+        self.workers = workers
+        self.max_queue = max_queue
+        self.shed_policy = shed_policy
+        self._queues: List[asyncio.Queue[QueueItem]] = []
+        self._tasks: List[asyncio.Task] = []
+
+        self._enqueued = 0
+        self._processed = 0
+        self._dropped = 0
+        self._failed = 0
+        self._latency_total = 0.0
+        self._latency_max = 0.0
+
+    @property
+    def running(self) -> bool:
+        return bool(self._tasks)
+
+    def _shard(self, message: MessageData) -> asyncio.Queue[QueueItem]:
+        index = zlib.crc32(message.number.encode()) % len(self._queues)
+        return self._queues[index]
+
+    async def start(self) -> None:
+        if self.running:
+            return
+        self._queues = [asyncio.Queue(self.max_queue) for _ in range(self.workers)]
+        self._tasks = [
+            asyncio.create_task(self._worker(queue), name=f"dispatcher-{i}")
+            for i, queue in enumerate(self._queues)
+        ]
+        logger.info(f"[Dispatcher] {self.workers} workers iniciados.")
+
+    async def stop(self, drain_timeout: float = 5.0) -> None:
+        """Aguarda as filas esvaziarem (até `drain_timeout`) e encerra os workers."""
+        if not self.running:
+            return
+        try:
+            async with asyncio.timeout(drain_timeout):
+                await asyncio.gather(*(queue.join() for queue in self._queues))
+        except TimeoutError:
+            logger.warning("[Dispatcher] Encerrando com mensagens ainda na fila.")
+
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+
+    def submit(self, message: MessageData) -> bool:
+        """Enfileira sem bloquear; retorna False se a mensagem foi descartada."""
+        if not self.running:
+            logger.error("[Dispatcher] Mensagem recebida com o pipeline parado.")
+            self._dropped += 1
+            return False
+
+        queue = self._shard(message)
+        if queue.full():
+            self._dropped += 1
+            if self.shed_policy == "drop_newest":
+                logger.warning(
+                    f"[Dispatcher] Fila cheia, descartando {message.message_id}."
+                )
+                return False
+            _, oldest = queue.get_nowait()
+            queue.task_done()
+            logger.warning(f"[Dispatcher] Fila cheia, descartando {oldest.message_id}.")
+
+        queue.put_nowait((time.monotonic(), message))
+        self._enqueued += 1
+        return True
+
+    async def _worker(self, queue: asyncio.Queue[QueueItem]) -> None:
+        while True:
+            enqueued_at, message = await queue.get()
+            try:
+                await self._handle(message)
+            finally:
+                latency = time.monotonic() - enqueued_at
+                self._processed += 1
+                self._latency_total += latency
+                self._latency_max = max(self._latency_max, latency)
+                queue.task_done()
+
+    async def _handle(self, message: MessageData) -> None:
+        message_type = MessageType(message.type).value
+        for module in module_registry.get_all():
+            if not module.accepts(message_type):
+                continue
+            try:
+                await module.handle_message(message)
+            except Exception as e:
+                self._failed += 1
+                logger.exception(
+                    f"[Dispatcher] Erro no módulo '{module.name}' ao processar "
+                    f"{message.message_id}: {e}"
+                )
+
+    def stats(self) -> Dict[str, Any]:
+        sizes = [queue.qsize() for queue in self._queues]
+        return {
+            "workers": self.workers,
+            "queue_length": sum(sizes),
+            "max_shard_length": max(sizes, default=0),
+            "max_queue": self.max_queue,
+            "enqueued": self._enqueued,
+            "processed": self._processed,
+            "dropped": self._dropped,
+            "failed": self._failed,
+            "avg_latency_ms": round(
+                self._latency_total / self._processed * 1000 if self._processed else 0,
+                3,
+            ),
+            "max_latency_ms": round(self._latency_max * 1000, 3),
+        }
+
+
+message_dispatcher = MessageDispatcher(
+    workers=settings.DISPATCH_WORKERS,
+    max_queue=settings.DISPATCH_MAX_QUEUE,
+    shed_policy=settings.DISPATCH_SHED_POLICY,
+)
+metrics_registry.register("dispatcher", message_dispatcher.stats)
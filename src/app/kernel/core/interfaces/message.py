@@ -33,7 +33,8 @@ class MessageData(BaseModel):
     client: ChatClient
 
     cached_hash: Optional[ImageHash] = None
-    cached_b64: Optional[str] = None
+    media_key: Optional[str] = None
+    cached_media: Optional[bytes] = None
 
     @computed_field
     def is_media(self) -> bool:
@@ -39,6 +39,10 @@ class BaseModule(ABC):
     def register_routes(self) -> Optional[APIRouter]:
         pass
 
+    def accepts(self, message_type: str) -> bool:
+        """Indica se o módulo processa mensagens deste tipo (padrão: todas)."""
+        return True
+
     @abstractmethod
     async def handle_message(self, message: MessageData):
         pass
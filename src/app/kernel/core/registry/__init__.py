@@ -1,6 +1,8 @@
 from .module_registry import ModuleRegistry
 from .response_registry import ResponseRegistry
+from .metrics_registry import MetricsRegistry
 
 module_registry = ModuleRegistry()
 response_registry = ResponseRegistry()
-__all__ = ["module_registry", "response_registry"]
+metrics_registry = MetricsRegistry()
+__all__ = ["module_registry", "response_registry", "metrics_registry"]
@@ -0,0 +1,19 @@
+from typing import Any, Callable, Dict, List
+
+MetricsSource = Callable[[], Dict[str, Any]]
+
+
+class MetricsRegistry:
+    def __init__(self):
+        self._sources: Dict[str, MetricsSource] = {}
+
+    def register(self, name: str, source: MetricsSource):
+        """Registra uma função que retorna as métricas atuais de um componente."""
+        self._sources[name] = source
+        return source
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        return {name: source() for name, source in self._sources.items()}
+
+    def list_sources(self) -> List[str]:
+        return list(self._sources.keys())
@@ -1,4 +1,28 @@
-from .services import external_api, storage_service, translate_service
+from .services import (
+    external_api,
+    storage_service,
+    translate_service,
+    media_client,
+    dataset_cache,
+    phash_cache,
+    asset_cache,
+    asset_pipeline,
+    presigned_urls,
+    image_hasher,
+    webhook_deduplicator,
+)
 
 
-__all__ = ["external_api", "storage_service", "translate_service"]
+__all__ = [
+    "external_api",
+    "storage_service",
+    "translate_service",
+    "media_client",
+    "dataset_cache",
+    "phash_cache",
+    "asset_cache",
+    "asset_pipeline",
+    "presigned_urls",
+    "image_hasher",
+    "webhook_deduplicator",
+]
@@ -1,3 +1,4 @@
 from .base_http_client import BaseHttpClient
+from .resilience import AdaptiveLimiter, CircuitBreaker, CircuitOpenError
 
-__all__ = ["BaseHttpClient"]
+__all__ = ["BaseHttpClient", "AdaptiveLimiter", "CircuitBreaker", "CircuitOpenError"]
@@ -1,9 +1,14 @@
 import asyncio
 import time
-from typing import Any, Dict, Optional, TypeVar
+import weakref
+from typing import Any, Awaitable, Callable, Dict, Optional, TypeVar
+from urllib.parse import urlsplit
 
 import httpx
 from loguru import logger
+
+from app.kernel.core.registry import metrics_registry
+from .resilience import AdaptiveLimiter, CircuitBreaker, CircuitOpenError
 from tenacity import (
     AsyncRetrying,
     retry_if_exception,
@@ -22,6 +27,56 @@ def is_retryable_exception(exc: BaseException) -> bool:
     )
 
 
+def is_host_failure(exc: BaseException) -> bool:
+    """Falhas que indicam host com problema: rede, 429 e qualquer 5xx."""
+    if isinstance(exc, httpx.HTTPStatusError):
+        status = exc.response.status_code
+        return status == 429 or status >= 500
+    return isinstance(
+        exc, (httpx.ConnectError, httpx.TimeoutException, httpx.NetworkError)
+    )
+
+
+# Um breaker por host, compartilhado por todos os clientes que falam com ele.
+_breakers: Dict[str, CircuitBreaker] = {}
+
+
+def breaker_for(
+    url: str, failure_threshold: int, reset_timeout: float
+) -> CircuitBreaker:
+    host = urlsplit(url).netloc
+    breaker = _breakers.get(host)
+    if breaker is None:
+        breaker = _breakers[host] = CircuitBreaker(
+            host, failure_threshold, reset_timeout
+        )
+    return breaker
+
+
+# Limite de concorrência adaptativo de cada instância de cliente; instâncias
+# repetidas da mesma classe ganham um sufixo (`Classe#2`).
+_limiters: "weakref.WeakValueDictionary[str, AdaptiveLimiter]" = (
+    weakref.WeakValueDictionary()
+)
+
+
+def _register_limiter(name: str, limiter: AdaptiveLimiter) -> None:
+    key, n = name, 1
+    while key in _limiters:
+        n += 1
+        key = f"{name}#{n}"
+    _limiters[key] = limiter
+
+
+metrics_registry.register(
+    "circuit_breakers", lambda: {host: b.stats() for host, b in _breakers.items()}
+)
+metrics_registry.register(
+    "http_limiters",
+    lambda: {name: limiter.stats() for name, limiter in list(_limiters.items())},
+)
+
+
 class BaseHttpClient:
     _instances: Dict[Any, "BaseHttpClient"] = {}
 
@@ -43,6 +98,8 @@ class BaseHttpClient:
         retry_attempts: int = 3,
         retry_min_wait: int = 2,
         retry_max_wait: int = 10,
+        breaker_threshold: int = 5,
+        breaker_reset_timeout: float = 30.0,
     ):
         if hasattr(self, "_initialized"):
             return
@@ -52,9 +109,17 @@ class BaseHttpClient:
         self.headers = headers or {}
         self.timeout = timeout
         self.rate_limit_delay = rate_limit_delay
-        self._last_request_time = 0.0
+        self._next_request_at = 0.0
 
-        self._semaphore = asyncio.Semaphore(max_concurrent)
+        # `max_concurrent` é o ponto de partida; o limite se ajusta ao upstream.
+        self._limiter = AdaptiveLimiter(
+            initial=max_concurrent,
+            max_limit=max_connections,
+            is_overload=is_retryable_exception,
+        )
+        _register_limiter(type(self).__name__, self._limiter)
+        self.breaker_threshold = breaker_threshold
+        self.breaker_reset_timeout = breaker_reset_timeout
         self.limits = httpx.Limits(
             max_connections=max_connections,
             max_keepalive_connections=max_keepalive_connections,
@@ -104,9 +169,48 @@ class BaseHttpClient:
         except (httpx.DecodingError, ValueError):
             return {"status": "success", "text": response.text}
 
+    async def _call(
+        self, url: str, fn: Callable[..., Awaitable[Any]], *args, **kwargs
+    ) -> Any:
+        """Executa `fn` com retentativas, circuit breaker do host e limite adaptativo."""
+        return await self._retrier(self._guarded, url, fn, *args, **kwargs)
+
+    async def _guarded(
+        self, url: str, fn: Callable[..., Awaitable[Any]], *args, **kwargs
+    ) -> Any:
+        breaker = breaker_for(url, self.breaker_threshold, self.breaker_reset_timeout)
+        breaker.before_call()
+        try:
+            async with self._limiter:
+                result = await fn(*args, **kwargs)
+        except httpx.HTTPStatusError as e:
+            # Só 4xx (exceto 429) mostram que o host está de pé; 429/5xx contam.
+            if is_host_failure(e):
+                breaker.record_failure()
+            else:
+                breaker.record_success()
+            raise
+        except Exception as e:
+            # Falhas de rede contam; outros erros não dizem nada sobre o host.
+            if is_host_failure(e):
+                breaker.record_failure()
+            else:
+                breaker.release()
+            raise
+        except BaseException:
+            # Cancelamento não diz nada sobre o host, mas não pode prender a sonda.
+            breaker.release()
+            raise
+        breaker.record_success()
+        return result
+
     async def request(self, method: str, endpoint: str, **kwargs) -> Dict[str, Any]:
-        elapsed = time.monotonic() - self._last_request_time
-        if (delay := self.rate_limit_delay - elapsed) > 0:
+        # Reserva o próximo horário livre antes de qualquer await, para que
+        # chamadas concorrentes fiquem espaçadas em vez de saírem juntas.
+        now = time.monotonic()
+        slot = max(now, self._next_request_at)
+        self._next_request_at = slot + self.rate_limit_delay
+        if (delay := slot - now) > 0:
             await asyncio.sleep(delay)
 
         try:
@@ -114,11 +218,11 @@ class BaseHttpClient:
             if kwargs.get("json") is None:
                 kwargs.pop("json", None)
 
-            async with self._semaphore:
-                res = await self._retrier(self._do_request, method, url, **kwargs)
-                self._last_request_time = time.monotonic()
-                return res
+            return await self._call(url, self._do_request, method, url, **kwargs)
 
+        except CircuitOpenError as e:
+            logger.warning(f"{e}: requisição para {url} recusada.")
+            raise e
         except httpx.HTTPStatusError as e:
             logger.exception(f"Erro de Status HTTP: {e.response.status_code} em {url}")
             raise e
@@ -0,0 +1,126 @@
+import asyncio
+import time
+from typing import Any, Callable, Dict, Optional
+
+from loguru import logger
+
+
+class CircuitOpenError(Exception):
+    """O circuito do host está aberto: a chamada foi recusada sem ir à rede."""
+
+
+class CircuitBreaker:
+    """
+    Circuit breaker de um host (closed -> open -> half_open -> closed).
+    Após `failure_threshold` falhas seguidas o circuito abre e as chamadas
+    falham na hora; passado `reset_timeout`, uma única chamada de teste é
+    liberada e o resultado dela decide se o circuito fecha ou reabre.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self, name: str, failure_threshold: int, reset_timeout: float):
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.state = self.CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._probing = False
+        self._rejected = 0
+
+    def before_call(self) -> None:
+        if self.state == self.CLOSED:
+            return
+        if (
+            self.state == self.OPEN
+            and time.monotonic() - self._opened_at >= self.reset_timeout
+        ):
+            self.state = self.HALF_OPEN
+            self._probing = False
+        if self.state == self.HALF_OPEN and not self._probing:
+            self._probing = True
+            return
+        self._rejected += 1
+        raise CircuitOpenError(f"Circuito aberto para {self.name}")
+
+    def record_success(self) -> None:
+        if self.state != self.CLOSED:
+            logger.info(f"[CircuitBreaker] {self.name} respondeu, circuito fechado.")
+        self.state = self.CLOSED
+        self._failures = 0
+        self._probing = False
+
+    def release(self) -> None:
+        """Chamada interrompida sem resposta (ex.: cancelada): libera a sonda."""
+        self._probing = False
+
+    def record_failure(self) -> None:
+        self._failures += 1
+        if self.state == self.HALF_OPEN or self._failures >= self.failure_threshold:
+            if self.state != self.OPEN:
+                logger.warning(
+                    f"[CircuitBreaker] {self.name} falhou {self._failures}x, "
+                    f"circuito aberto por {self.reset_timeout}s."
+                )
+            self.state = self.OPEN
+            self._opened_at = time.monotonic()
+            self._probing = False
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "state": self.state,
+            "failures": self._failures,
+            "rejected": self._rejected,
+        }
+
+
+class AdaptiveLimiter:
+    """
+    Limite de concorrência AIMD (additive increase / multiplicative decrease).
+    Cada chamada bem-sucedida com a janela cheia aumenta o limite em ~1 por
+    janela; sinais de sobrecarga do upstream (`is_overload`) cortam o limite
+    pela metade. Usado como `async with limiter:` no lugar de um Semaphore.
+    """
+
+    def __init__(
+        self,
+        initial: int,
+        max_limit: int,
+        is_overload: Callable[[BaseException], bool],
+        min_limit: int = 1,
+        backoff: float = 0.5,
+    ):
+        self.limit = float(initial)
+        self.min_limit = min_limit
+        self.max_limit = max(max_limit, initial)
+        self.backoff = backoff
+        self.is_overload = is_overload
+        self._inflight = 0
+        self._condition: Optional[asyncio.Condition] = None
+
+    @property
+    def condition(self) -> asyncio.Condition:
+        if self._condition is None:
+            self._condition = asyncio.Condition()
+        return self._condition
+
+    async def __aenter__(self) -> None:
+        async with self.condition:
+            await self.condition.wait_for(lambda: self._inflight < int(self.limit))
+            self._inflight += 1
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        if exc is not None and self.is_overload(exc):
+            self.limit = max(self.min_limit, self.limit * self.backoff)
+        elif exc is None and self._inflight >= int(self.limit):
+            self.limit = min(self.max_limit, self.limit + 1 / self.limit)
+
+        async with self.condition:
+            self._inflight -= 1
+            self.condition.notify_all()
+
+    def stats(self) -> Dict[str, Any]:
+        return {"limit": round(self.limit, 2), "inflight": self._inflight}
@@ -1,11 +1,14 @@
 from .schemas import EvolutionWebhook
 from .adapter import process_evolution_message
 from .client import evolution_client
+from .prefilter import loads_webhook, peek_webhook
 from .web import router as evolution_web_router
 
 __all__ = [
     "EvolutionWebhook",
     "process_evolution_message",
+    "loads_webhook",
+    "peek_webhook",
     "evolution_client",
     "evolution_web_router",
 ]
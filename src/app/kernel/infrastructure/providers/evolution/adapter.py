@@ -1,12 +1,12 @@
 from app.kernel.core.interfaces import MessageData
 from .schemas import EvolutionWebhook
-from .client import EvolutionClient
-from .parser import parse_message_content
+from .client import evolution_client
+from .parser import parse_message_content, get_media_key
 
 
 def process_evolution_message(data: EvolutionWebhook) -> MessageData:
-    data_message = {**(data.data.message or {}), "messageType": data.data.message_type}
-    tipo_str, body = parse_message_content(data_message)
+    data_message = data.data.message or {}
+    tipo_str, body = parse_message_content(data_message, data.data.message_type)
 
     msg_keys = data.data.key
     remote_jid = msg_keys.remote_jid
@@ -22,6 +22,7 @@ def process_evolution_message(data: EvolutionWebhook) -> MessageData:
         body=body,
         is_group=is_group,
         instance=data.instance,
-        client=EvolutionClient(),
+        client=evolution_client,
         mentioned=False,
+        media_key=get_media_key(data_message),
     )
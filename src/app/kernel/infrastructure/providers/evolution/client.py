@@ -1,8 +1,13 @@
 from app.kernel.core import ChatClient, ChatResponse, MediaType
 from app.kernel.infrastructure.network import BaseHttpClient
+from app.kernel.infrastructure.services import asset_pipeline
 from app.kernel.config import settings
 from typing import Any, Dict, List
 from loguru import logger
+import time
+
+from .media_cache import media_blobs
+from .outbound import outbound_scheduler
 
 
 class EvolutionClient(ChatClient, BaseHttpClient):
@@ -13,7 +18,8 @@ class EvolutionClient(ChatClient, BaseHttpClient):
                 "apikey": settings.EVOLUTION_TOKEN,
                 "Content-Type": "application/json",
             },
-            rate_limit_delay=0.05,
+            # Com o scheduler de saída o ritmo é controlado pelo token bucket.
+            rate_limit_delay=0.0 if outbound_scheduler else 0.05,
         )
 
     def _prepare_payload(self, **kwargs) -> Dict[str, Any]:
@@ -62,8 +68,13 @@ class EvolutionClient(ChatClient, BaseHttpClient):
         """
         if not audio.startswith("http"):
             audio = f"{settings.BUCKET_ENDPOINT}/{settings.BUCKET_NAME}/{audio}"
+        url = audio
+        if asset_pipeline.is_derived(url):
+            # Variante já convertida para ogg/opus no upload.
+            options.setdefault("encoding", False)
+        audio = await media_blobs.audio(url) or url
         payload = self._clean_payload({"number": number, "audio": audio, **options})
-        return await self._execute_send(instance, "sendWhatsAppAudio", payload)
+        return await self._timed_send(url, instance, "sendWhatsAppAudio", payload)
 
     async def send_sticker(
         self, instance: str, number: str, sticker: str, **options
@@ -75,8 +86,10 @@ class EvolutionClient(ChatClient, BaseHttpClient):
             sticker = sticker.split(";base64,")[1]
         elif not sticker.startswith("http"):
             sticker = f"{settings.BUCKET_ENDPOINT}/{settings.BUCKET_NAME}/{sticker}"
+        url = sticker
+        sticker = await media_blobs.sticker(url) or url
         payload = self._clean_payload({"number": number, "sticker": sticker, **options})
-        return await self._execute_send(instance, "sendSticker", payload)
+        return await self._timed_send(url, instance, "sendSticker", payload)
 
     async def send_contact(
         self, instance: str, number: str, contacts: List[Dict[str, Any]]
@@ -90,10 +103,28 @@ class EvolutionClient(ChatClient, BaseHttpClient):
         }
         return await self._execute_send(instance, "sendContact", payload)
 
+    async def _timed_send(
+        self, url: str, instance: str, path: str, payload: dict
+    ) -> ChatResponse:
+        """Envia a mídia registrando a latência por asset."""
+        started = time.perf_counter()
+        response = await self._execute_send(instance, path, payload)
+        media_blobs.record_send(url, time.perf_counter() - started)
+        return response
+
     async def _execute_send(
         self, instance: str, path: str, payload: dict
     ) -> ChatResponse:
         """Centraliza o envio e converte para ChatResponse."""
+        if outbound_scheduler:
+            return await outbound_scheduler.submit(
+                instance, str(payload.get("number")), path, payload, self._post_message
+            )
+        return await self._post_message(instance, path, payload)
+
+    async def _post_message(
+        self, instance: str, path: str, payload: dict
+    ) -> ChatResponse:
         endpoint = f"message/{path}/{instance}"
         try:
             response = await self.post(endpoint, json=payload)
@@ -158,6 +189,11 @@ class EvolutionClient(ChatClient, BaseHttpClient):
             logger.error(f"Erro ao configurar webhook da instância {instance}: {e}")
             return {}
 
+    async def close(self):
+        if outbound_scheduler:
+            await outbound_scheduler.close()
+        await super().close()
+
     async def initialize(self) -> bool:
         logger.info("Inicializando EvolutionClient...")
         instance = await self.fetch_instance(settings.EVOLUTION_INSTANCE)
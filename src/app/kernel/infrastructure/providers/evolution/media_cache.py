@@ -0,0 +1,155 @@
+import asyncio
+import time
+from base64 import b64encode
+from typing import Any, Callable, Dict, Optional
+
+from loguru import logger
+
+from app.kernel.config import settings
+from app.kernel.core.registry import metrics_registry
+from app.kernel.infrastructure.services import media_client
+from app.kernel.utils.cache import LRUCache
+from app.kernel.utils.image import to_sticker_webp
+
+
+class AssetStats:
+    __slots__ = ("conversions", "conversion_ms_total", "sends", "send_ms_total")
+
+    def __init__(self):
+        self.conversions = 0
+        self.conversion_ms_total = 0.0
+        self.sends = 0
+        self.send_ms_total = 0.0
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            "conversions": self.conversions,
+            "conversion_ms_total": round(self.conversion_ms_total, 3),
+            "avg_conversion_ms": round(
+                self.conversion_ms_total / self.conversions if self.conversions else 0,
+                3,
+            ),
+            "sends": self.sends,
+            "avg_send_ms": round(
+                self.send_ms_total / self.sends if self.sends else 0, 3
+            ),
+        }
+
+
+class MediaBlobCache:
+    """
+    Mídias do bucket já codificadas para a Evolution (base64), por URL sem
+    query string. Figurinhas são convertidas para webp 512x512 uma única vez;
+    áudios são guardados como estão. Assim os assets mais usados pelos
+    gatilhos não são baixados e reconvertidos pela Evolution a cada envio.
+    Mídias fora do bucket ou maiores que MEDIA_BLOB_MAX_BYTES seguem por URL;
+    a decisão de enviar por URL fica guardada por MEDIA_BLOB_FALLBACK_TTL, para
+    não repetir o download a cada envio.
+    """
+
+    def __init__(self):
+        self._blobs: LRUCache[str, str] = LRUCache(
+            maxsize=settings.MEDIA_BLOB_CACHE_SIZE, ttl=settings.MEDIA_BLOB_CACHE_TTL
+        )
+        self._assets: LRUCache[str, AssetStats] = LRUCache(
+            maxsize=settings.MEDIA_BLOB_CACHE_SIZE * 4
+        )
+        # Chaves que devem seguir por URL (falha no download/conversão ou tamanho).
+        self._url_only: LRUCache[str, bool] = LRUCache(
+            maxsize=settings.MEDIA_BLOB_CACHE_SIZE * 4,
+            ttl=settings.MEDIA_BLOB_FALLBACK_TTL,
+        )
+        self._inflight: Dict[str, asyncio.Task] = {}
+        self._failures = 0
+
+    @staticmethod
+    def key(url: str) -> str:
+        return url.split("?")[0]
+
+    @staticmethod
+    def is_asset(url: str) -> bool:
+        base_url = f"{settings.BUCKET_ENDPOINT.rstrip('/')}/{settings.BUCKET_NAME}/"
+        return url.startswith(base_url)
+
+    async def sticker(self, url: str) -> Optional[str]:
+        return await self._get(url, to_sticker_webp)
+
+    async def audio(self, url: str) -> Optional[str]:
+        return await self._get(url, None)
+
+    async def _get(
+        self, url: str, encode: Optional[Callable[[bytes], bytes]]
+    ) -> Optional[str]:
+        """Blob base64 da mídia, ou None para o chamador enviar a URL."""
+        if not settings.MEDIA_BLOB_CACHE_ENABLED or not self.is_asset(url):
+            return None
+
+        key = self.key(url)
+        blob = self._blobs.get(key)
+        if blob is not None:
+            return blob
+        if key in self._url_only:
+            return None
+
+        # Envios simultâneos do mesmo asset compartilham a conversão.
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._load(key, url, encode))
+            self._inflight[key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
+        return await asyncio.shield(task)
+
+    async def _load(
+        self, key: str, url: str, encode: Optional[Callable[[bytes], bytes]]
+    ) -> Optional[str]:
+        started = time.perf_counter()
+        data = await media_client.fetch_bytes(url, settings.MEDIA_BLOB_MAX_BYTES)
+        if data is None:
+            self._failures += 1
+            self._url_only.set(key, True)
+            return None
+
+        try:
+            if encode:
+                data = await asyncio.to_thread(encode, data)
+            blob = b64encode(data).decode("ascii")
+        except Exception as e:
+            self._failures += 1
+            logger.warning(f"[MediaBlobCache] Falha ao converter {key}: {e}")
+            self._url_only.set(key, True)
+            return None
+
+        stats = self._stats_for(key)
+        stats.conversions += 1
+        stats.conversion_ms_total += (time.perf_counter() - started) * 1000
+        self._blobs.set(key, blob)
+        return blob
+
+    def _stats_for(self, key: str) -> AssetStats:
+        stats = self._assets.get(key)
+        if stats is None:
+            stats = AssetStats()
+            self._assets.set(key, stats)
+        return stats
+
+    def record_send(self, url: str, elapsed: float) -> None:
+        if self.is_asset(url):
+            stats = self._stats_for(self.key(url))
+            stats.sends += 1
+            stats.send_ms_total += elapsed * 1000
+
+    def stats(self) -> Dict[str, Any]:
+        stats = self._blobs.stats()
+        stats["failures"] = self._failures
+        stats["url_only"] = len(self._url_only)
+        top = sorted(
+            ((key, asset) for key, asset, _ in self._assets.items()),
+            key=lambda entry: entry[1].sends,
+            reverse=True,
+        )[:20]
+        stats["assets"] = {key: asset.as_dict() for key, asset in top}
+        return stats
+
+
+media_blobs = MediaBlobCache()
+metrics_registry.register("evolution_media", media_blobs.stats)
@@ -0,0 +1,178 @@
+import asyncio
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Deque, Dict, Optional
+
+from loguru import logger
+
+from app.kernel.config import settings
+from app.kernel.core import ChatResponse
+from app.kernel.core.registry import metrics_registry
+
+SendFn = Callable[[str, str, Dict[str, Any]], Awaitable[ChatResponse]]
+
+
+@dataclass
+class OutboundItem:
+    instance: str
+    path: str
+    payload: Dict[str, Any]
+    send: SendFn
+    enqueued_at: float = field(default_factory=time.monotonic)
+    future: asyncio.Future = field(
+        default_factory=lambda: asyncio.get_running_loop().create_future()
+    )
+
+    def can_absorb(self, other: "OutboundItem") -> bool:
+        """Textos seguidos com as mesmas opções podem virar uma mensagem só."""
+        if self.path != "sendText" or other.path != "sendText":
+            return False
+        mine = {k: v for k, v in self.payload.items() if k != "text"}
+        theirs = {k: v for k, v in other.payload.items() if k != "text"}
+        return self.instance == other.instance and mine == theirs
+
+
+class TokenBucket:
+    """Token bucket global por reserva: cada envio agenda seu horário na hora."""
+
+    def __init__(self, rate: float, burst: int):
+        self.rate = rate
+        self.burst = burst
+        self._tokens = float(burst)
+        self._updated_at = time.monotonic()
+
+    async def take(self) -> None:
+        now = time.monotonic()
+        self._tokens = min(
+            self.burst, self._tokens + (now - self._updated_at) * self.rate
+        )
+        self._updated_at = now
+        self._tokens -= 1
+        if self._tokens < 0:
+            await asyncio.sleep(-self._tokens / self.rate)
+
+
+class OutboundScheduler:
+    """
+    Fila de saída das mensagens enviadas pela Evolution.
+    Cada chat tem uma fila FIFO própria drenada por uma task (as respostas
+    chegam na ordem em que foram pedidas), e todos os envios passam por um
+    token bucket global (OUTBOUND_RATE/OUTBOUND_BURST). Com
+    OUTBOUND_COALESCE_WINDOW_MS > 0, textos consecutivos para o mesmo chat
+    dentro da janela são enviados como uma única mensagem.
+    """
+
+    def __init__(self, rate: float, burst: int, coalesce_window_ms: float):
+        self.bucket = TokenBucket(rate, burst)
+        self.coalesce_window = coalesce_window_ms / 1000
+        self._queues: Dict[str, Deque[OutboundItem]] = {}
+        self._drainers: Dict[str, asyncio.Task] = {}
+
+        self._sent = 0
+        self._coalesced = 0
+        self._failed = 0
+        self._latency_total = 0.0
+        self._latency_max = 0.0
+
+    async def submit(
+        self,
+        instance: str,
+        number: str,
+        path: str,
+        payload: Dict[str, Any],
+        send: SendFn,
+    ) -> ChatResponse:
+        chat = f"{instance}:{number}"
+        queue = self._queues.setdefault(chat, deque())
+        item = OutboundItem(instance, path, payload, send)
+
+        if self.coalesce_window and queue and queue[-1].can_absorb(item):
+            last = queue[-1]
+            last.payload["text"] = f"{last.payload['text']}\n{payload['text']}"
+            self._coalesced += 1
+            return await asyncio.shield(last.future)
+
+        queue.append(item)
+        if chat not in self._drainers:
+            self._drainers[chat] = asyncio.create_task(
+                self._drain(chat, queue), name=f"outbound-{chat}"
+            )
+        return await asyncio.shield(item.future)
+
+    async def _drain(self, chat: str, queue: Deque[OutboundItem]):
+        item: Optional[OutboundItem] = None
+        try:
+            while queue:
+                item = queue[0]
+                if item.path == "sendText" and self.coalesce_window:
+                    wait = item.enqueued_at + self.coalesce_window - time.monotonic()
+                    if wait > 0:
+                        await asyncio.sleep(wait)
+
+                await self.bucket.take()
+                # Fora da fila o item não recebe mais textos agrupados.
+                queue.popleft()
+                try:
+                    response = await item.send(item.instance, item.path, item.payload)
+                except Exception as e:
+                    logger.error(f"[Outbound] Falha ao enviar para {chat}: {e}")
+                    response = ChatResponse(
+                        status="error", id="err", error_message=str(e)
+                    )
+                self._record(item, response)
+        finally:
+            self._drainers.pop(chat, None)
+            self._queues.pop(chat, None)
+            # Inclui o item em envio, já fora da fila, se o drain foi cancelado.
+            for pending in (item, *queue) if item else queue:
+                if not pending.future.done():
+                    pending.future.cancel()
+
+    def _record(self, item: OutboundItem, response: ChatResponse) -> None:
+        latency = time.monotonic() - item.enqueued_at
+        self._sent += 1
+        if response.status != "success":
+            self._failed += 1
+        self._latency_total += latency
+        self._latency_max = max(self._latency_max, latency)
+        if not item.future.done():
+            item.future.set_result(response)
+
+    async def close(self, drain_timeout: float = 5.0) -> None:
+        """Aguarda as filas esvaziarem (até `drain_timeout`) e cancela o resto."""
+        drainers = list(self._drainers.values())
+        if not drainers:
+            return
+        _, pending = await asyncio.wait(drainers, timeout=drain_timeout)
+        for task in pending:
+            task.cancel()
+        await asyncio.gather(*pending, return_exceptions=True)
+
+    def stats(self) -> Dict[str, Any]:
+        depths = [len(queue) for queue in self._queues.values()]
+        return {
+            "queue_depth": sum(depths),
+            "max_chat_depth": max(depths, default=0),
+            "active_chats": len(self._drainers),
+            "sent": self._sent,
+            "failed": self._failed,
+            "coalesced": self._coalesced,
+            "avg_send_latency_ms": round(
+                self._latency_total / self._sent * 1000 if self._sent else 0, 3
+            ),
+            "max_send_latency_ms": round(self._latency_max * 1000, 3),
+        }
+
+
+outbound_scheduler: Optional[OutboundScheduler] = (
+    OutboundScheduler(
+        rate=settings.OUTBOUND_RATE,
+        burst=settings.OUTBOUND_BURST,
+        coalesce_window_ms=settings.OUTBOUND_COALESCE_WINDOW_MS,
+    )
+    if settings.OUTBOUND_ENABLED
+    else None
+)
+if outbound_scheduler:
+    metrics_registry.register("outbound", outbound_scheduler.stats)
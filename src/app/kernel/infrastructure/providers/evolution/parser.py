@@ -1,6 +1,6 @@
 import json
 import re
-from typing import Any, Callable, Dict, Tuple
+from typing import Any, Callable, Dict, Optional, Tuple
 
 
 def _get_media_body(
@@ -88,12 +88,26 @@ TREAT_DICT: Dict[str, Callable[[Dict[str, Any]], Tuple[str, str]]] = {
 }
 
 
-def parse_message_content(data: Dict[str, Any]) -> Tuple[str, str]:
+MEDIA_KEYS = ("stickerMessage", "imageMessage", "videoMessage", "documentMessage")
+
+
+def get_media_key(data: Dict[str, Any]) -> Optional[str]:
+    """Retorna o SHA-256 do arquivo de mídia (igual entre encaminhamentos)."""
+    for msg_key in MEDIA_KEYS:
+        content = data.get(msg_key)
+        if isinstance(content, dict):
+            sha = content.get("fileSha256")
+            return sha if isinstance(sha, str) and sha else None
+    return None
+
+
+def parse_message_content(
+    message: Dict[str, Any], message_type: Optional[str]
+) -> Tuple[str, str]:
     """Extrai o tipo e o conteúdo textual/url de uma mensagem da Evolution API."""
-    tipo_original = str(data.get("messageType", "unknown"))
-    handler = TREAT_DICT.get(tipo_original)
+    handler = TREAT_DICT.get(str(message_type or "unknown"))
 
     if handler:
-        return handler(data)
+        return handler(message)
 
     return "unknown", "Conteúdo não suportado"
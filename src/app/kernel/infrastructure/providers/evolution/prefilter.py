@@ -0,0 +1,55 @@
+from typing import Any, Dict, NamedTuple, Optional
+
+import orjson
+
+
+def loads_webhook(raw: bytes) -> Any:
+    return orjson.loads(raw)
+
+
+# Tipos da Evolution que o parser converte em um MessageType válido.
+SUPPORTED_MESSAGE_TYPES: Dict[str, str] = {
+    "conversation": "text",
+    "extendedTextMessage": "text",
+    "imageMessage": "image",
+    "videoMessage": "video",
+    "audioMessage": "audio",
+    "documentMessage": "document",
+    "stickerMessage": "sticker",
+}
+
+ACCEPTED_EVENTS = {"messages.upsert", "MESSAGES_UPSERT"}
+
+
+class WebhookPeek(NamedTuple):
+    instance: str
+    message_id: str
+    message_type: str
+
+
+def peek_webhook(payload: Any) -> Optional[WebhookPeek]:
+    """
+    Inspeciona o JSON cru e decide se o webhook merece validação completa.
+    Retorna None para eventos que seriam ignorados: outros eventos, mensagens
+    enviadas pelo próprio bot (fromMe) ou tipos de mensagem não suportados.
+    """
+    if not isinstance(payload, dict) or payload.get("event") not in ACCEPTED_EVENTS:
+        return None
+
+    data = payload.get("data")
+    if not isinstance(data, dict):
+        return None
+
+    key = data.get("key")
+    if not isinstance(key, dict) or key.get("fromMe"):
+        return None
+
+    message_type = SUPPORTED_MESSAGE_TYPES.get(data.get("messageType"))
+    if message_type is None:
+        return None
+
+    return WebhookPeek(
+        instance=str(payload.get("instance", "")),
+        message_id=str(key.get("id", "")),
+        message_type=message_type,
+    )
@@ -1,9 +1,39 @@
 from .storage import StorageService
 from .translate import TranslateClient
 from .api_client import ExternalApiClient
+from .media import MediaClient
+from .phash_cache import phash_cache
+from .asset_cache import AssetCache
+from .presigned import PresignedUrlCache
+from .image_hasher import image_hasher
+from .dedupe import webhook_deduplicator
+from .datasets import DatasetCache
+from .asset_pipeline import AssetPipeline
+from app.kernel.core.registry import metrics_registry
 
 storage_service = StorageService()
 translate_service = TranslateClient()
 external_api = ExternalApiClient()
+media_client = MediaClient()
+dataset_cache = DatasetCache(external_api)
+asset_cache = AssetCache(storage_service)
+presigned_urls = PresignedUrlCache(storage_service)
+asset_pipeline = AssetPipeline(storage_service)
+metrics_registry.register("datasets", dataset_cache.stats)
+metrics_registry.register("asset_cache", asset_cache.stats)
+metrics_registry.register("presigned_urls", presigned_urls.stats)
+metrics_registry.register("translate", translate_service.stats)
 
-__all__ = ["storage_service", "translate_service", "external_api"]
+__all__ = [
+    "storage_service",
+    "translate_service",
+    "external_api",
+    "media_client",
+    "dataset_cache",
+    "phash_cache",
+    "asset_cache",
+    "asset_pipeline",
+    "presigned_urls",
+    "image_hasher",
+    "webhook_deduplicator",
+]
@@ -1,4 +1,8 @@
 from typing import Any, Optional
+
+import httpx
+from loguru import logger
+
 from ..network import BaseHttpClient
 
 
@@ -19,3 +23,32 @@ class ExternalApiClient(BaseHttpClient):
             return await self.request("GET", url)
         except Exception:
             return None
+
+    async def fetch_if_modified(
+        self,
+        url: str,
+        etag: Optional[str] = None,
+        last_modified: Optional[str] = None,
+    ) -> Optional[httpx.Response]:
+        """
+        GET condicional (If-None-Match / If-Modified-Since).
+        Retorna a resposta (200 ou 304) ou None em caso de erro.
+        """
+        headers = {}
+        if etag:
+            headers["If-None-Match"] = etag
+        if last_modified:
+            headers["If-Modified-Since"] = last_modified
+
+        try:
+            return await self._call(url, self._conditional_get, url, headers)
+        except Exception as e:
+            logger.warning(f"Falha no GET condicional de {url}: {e}")
+            return None
+
+    async def _conditional_get(self, url: str, headers: dict) -> httpx.Response:
+        client = await self.get_http_client()
+        response = await client.get(url, headers=headers)
+        if response.status_code != 304:
+            response.raise_for_status()
+        return response
@@ -0,0 +1,90 @@
+import asyncio
+import hashlib
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+from loguru import logger
+
+from app.kernel.config import settings
+from .storage import StorageService
+
+
+class AssetCache:
+    """
+    Cópia local dos arquivos do bucket lidos na montagem dos gatilhos.
+    Cada leitura revalida pelo ETag (If-None-Match), então um arquivo que não
+    mudou não é baixado de novo; sem acesso ao storage, a cópia em disco é usada.
+    """
+
+    def __init__(self, storage: StorageService):
+        self.storage = storage
+        self.path: Optional[Path] = (
+            Path(settings.SETTINGS_PATH) / "cache" / "assets"
+            if settings.ASSET_CACHE_ENABLED
+            else None
+        )
+        self._not_modified = 0
+        self._downloaded = 0
+        self._stale = 0
+        self._missing = 0
+
+    def _files(self, key: str) -> Tuple[Path, Path]:
+        name = hashlib.sha1(key.encode()).hexdigest()
+        return self.path / f"{name}.bin", self.path / f"{name}.etag"
+
+    def _read_local(self, key: str) -> Tuple[Optional[bytes], Optional[str]]:
+        if not self.path:
+            return None, None
+        data_path, etag_path = self._files(key)
+        if not data_path.exists():
+            return None, None
+        etag = etag_path.read_text() if etag_path.exists() else None
+        return data_path.read_bytes(), etag
+
+    def _write_local(self, key: str, content: bytes, etag: Optional[str]) -> None:
+        if not self.path:
+            return
+        self.path.mkdir(parents=True, exist_ok=True)
+        data_path, etag_path = self._files(key)
+        tmp_path = data_path.with_suffix(".tmp")
+        tmp_path.write_bytes(content)
+        tmp_path.replace(data_path)
+        if etag:
+            etag_path.write_text(etag)
+        else:
+            etag_path.unlink(missing_ok=True)
+
+    async def get(self, key: str) -> Optional[bytes]:
+        try:
+            local, etag = await asyncio.to_thread(self._read_local, key)
+        except OSError as e:
+            logger.warning(f"[AssetCache] Falha ao ler cópia local de '{key}': {e}")
+            local, etag = None, None
+
+        item = await self.storage.get_item_if_changed(key, etag if local else None)
+        if item is None:
+            if local is not None:
+                self._stale += 1
+                return local
+            self._missing += 1
+            return None
+
+        if item.content is None:
+            self._not_modified += 1
+            return local
+
+        self._downloaded += 1
+        try:
+            await asyncio.to_thread(self._write_local, key, item.content, item.etag)
+        except OSError as e:
+            logger.warning(f"[AssetCache] Falha ao gravar '{key}' em disco: {e}")
+        return item.content
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "enabled": self.path is not None,
+            "not_modified": self._not_modified,
+            "downloaded": self._downloaded,
+            "stale": self._stale,
+            "missing": self._missing,
+        }
@@ -0,0 +1,82 @@
+import asyncio
+import os
+import tempfile
+from pathlib import PurePosixPath
+from typing import BinaryIO, Optional, Set
+
+from loguru import logger
+
+from app.kernel.config import settings
+from app.kernel.utils.audio import to_ogg_opus
+from app.kernel.utils.image import write_sticker_webp
+from .storage import StorageService
+
+DERIVED_PREFIX = "assets/derived/"
+
+# tipo de mídia -> (extensão, content type) da variante nativa do WhatsApp
+DERIVED_FORMATS = {
+    "sticker": (".webp", "image/webp"),
+    "audio": (".ogg", "audio/ogg; codecs=opus"),
+}
+
+
+class AssetPipeline:
+    """
+    Variantes nativas do WhatsApp geradas no upload: figurinhas em webp
+    512x512 e áudios em ogg/opus. O original continua no bucket e a variante
+    fica em `assets/derived/<nome>.<ext>`, então quem envia pode preferi-la
+    sem a Evolution converter a mídia a cada envio.
+    """
+
+    def __init__(self, storage: StorageService):
+        self.storage = storage
+
+    @staticmethod
+    def derived_key(key: str, kind: str) -> Optional[str]:
+        if kind not in DERIVED_FORMATS or not key or key.startswith(DERIVED_PREFIX):
+            return None
+        extension, _ = DERIVED_FORMATS[kind]
+        return f"{DERIVED_PREFIX}{PurePosixPath(key).stem}{extension}"
+
+    @staticmethod
+    def is_derived(key: str) -> bool:
+        return DERIVED_PREFIX in key
+
+    async def derive(self, key: str, source: BinaryIO, kind: str) -> Optional[str]:
+        """
+        Converte e grava a variante do arquivo; retorna a chave ou None.
+        `source` é lido em streaming (ex.: `UploadFile.file`) e a conversão
+        vai para um arquivo temporário, então a memória não cresce com o
+        tamanho do upload. Arquivos acima de ASSET_TRANSCODE_MAX_BYTES ficam
+        só com o original.
+        """
+        derived = self.derived_key(key, kind)
+        if not derived:
+            return None
+
+        size = source.seek(0, os.SEEK_END)
+        source.seek(0)
+        if size > settings.ASSET_TRANSCODE_MAX_BYTES:
+            logger.warning(
+                f"[AssetPipeline] '{key}' tem {size} bytes (limite "
+                f"{settings.ASSET_TRANSCODE_MAX_BYTES}); variante não gerada."
+            )
+            return None
+
+        with tempfile.TemporaryFile() as target:
+            try:
+                if kind == "sticker":
+                    await asyncio.to_thread(write_sticker_webp, source, target)
+                elif not await to_ogg_opus(source, target):
+                    return None
+            except Exception as e:
+                logger.warning(f"[AssetPipeline] Falha ao converter '{key}': {e}")
+                return None
+
+            target.seek(0)
+            _, content_type = DERIVED_FORMATS[kind]
+            return await self.storage.upload_file(derived, target, content_type)
+
+    async def available(self) -> Set[str]:
+        """Chaves das variantes já existentes no bucket."""
+        return set(await self.storage.list_all_files(DERIVED_PREFIX))
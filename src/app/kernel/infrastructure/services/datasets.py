@@ -0,0 +1,136 @@
+import asyncio
+import hashlib
+import json
+import random
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from loguru import logger
+
+from app.kernel.config import settings
+from .api_client import ExternalApiClient
+
+
+@dataclass
+class _Dataset:
+    items: List[Any] = field(default_factory=list)
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+    checked_at: float = 0.0
+    lock: asyncio.Lock = field(default_factory=asyncio.Lock)
+    refresh_task: Optional[asyncio.Task] = None
+
+
+class DatasetCache:
+    """
+    Cache de listas JSON estáticas servidas por URL (ex.: frases.json).
+    A lista é baixada uma vez, mantida em memória e em disco, e revalidada por
+    GET condicional (ETag / Last-Modified) a cada DATASET_REFRESH_INTERVAL.
+    Enquanto revalida, os sorteios continuam usando a cópia atual.
+    """
+
+    def __init__(self, client: ExternalApiClient):
+        self.client = client
+        self.path = Path(settings.SETTINGS_PATH) / "cache" / "datasets"
+        self._datasets: Dict[str, _Dataset] = {}
+        self._downloads = 0
+        self._not_modified = 0
+        self._errors = 0
+
+    def _files(self, url: str) -> Path:
+        return self.path / f"{hashlib.sha1(url.encode()).hexdigest()}.json"
+
+    async def get(self, url: str) -> List[Any]:
+        dataset = self._datasets.setdefault(url, _Dataset())
+        if not dataset.items:
+            await self._refresh(url, dataset)
+        elif time.monotonic() - dataset.checked_at > settings.DATASET_REFRESH_INTERVAL:
+            if dataset.refresh_task is None or dataset.refresh_task.done():
+                dataset.refresh_task = asyncio.create_task(self._refresh(url, dataset))
+        return dataset.items
+
+    async def random_item(self, url: str) -> Optional[Any]:
+        items = await self.get(url)
+        return random.choice(items) if items else None
+
+    async def _refresh(self, url: str, dataset: _Dataset) -> None:
+        async with dataset.lock:
+            if (
+                dataset.items
+                and time.monotonic() - dataset.checked_at
+                <= settings.DATASET_REFRESH_INTERVAL
+            ):
+                return
+            if not dataset.items:
+                await asyncio.to_thread(self._load_local, url, dataset)
+
+            response = await self.client.fetch_if_modified(
+                url, dataset.etag, dataset.last_modified
+            )
+            dataset.checked_at = time.monotonic()
+            if response is None:
+                self._errors += 1
+                return
+            if response.status_code == 304:
+                self._not_modified += 1
+                return
+
+            try:
+                items = response.json()
+            except ValueError as e:
+                self._errors += 1
+                logger.warning(f"[Datasets] JSON inválido em {url}: {e}")
+                return
+            if not isinstance(items, list):
+                self._errors += 1
+                logger.warning(f"[Datasets] {url} não contém uma lista JSON.")
+                return
+
+            self._downloads += 1
+            dataset.items = items
+            dataset.etag = response.headers.get("etag")
+            dataset.last_modified = response.headers.get("last-modified")
+            await asyncio.to_thread(self._save_local, url, dataset)
+
+    def _load_local(self, url: str, dataset: _Dataset) -> None:
+        file = self._files(url)
+        if not file.exists():
+            return
+        try:
+            snapshot = json.loads(file.read_text(encoding="utf-8"))
+            dataset.items = snapshot["items"]
+            dataset.etag = snapshot.get("etag")
+            dataset.last_modified = snapshot.get("last_modified")
+        except Exception as e:
+            logger.warning(f"[Datasets] Falha ao carregar cópia local de {url}: {e}")
+
+    def _save_local(self, url: str, dataset: _Dataset) -> None:
+        try:
+            self.path.mkdir(parents=True, exist_ok=True)
+            file = self._files(url)
+            tmp_path = file.with_suffix(".tmp")
+            tmp_path.write_text(
+                json.dumps(
+                    {
+                        "url": url,
+                        "etag": dataset.etag,
+                        "last_modified": dataset.last_modified,
+                        "items": dataset.items,
+                    },
+                    ensure_ascii=False,
+                ),
+                encoding="utf-8",
+            )
+            tmp_path.replace(file)
+        except Exception as e:
+            logger.warning(f"[Datasets] Falha ao salvar cópia local de {url}: {e}")
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "datasets": {url: len(d.items) for url, d in self._datasets.items()},
+            "downloads": self._downloads,
+            "not_modified": self._not_modified,
+            "errors": self._errors,
+        }
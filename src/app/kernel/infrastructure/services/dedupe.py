@@ -0,0 +1,122 @@
+from typing import Any, Dict, Optional, Protocol
+
+from loguru import logger
+
+from app.kernel.config import settings
+from app.kernel.core.registry import metrics_registry
+from app.kernel.utils.cache import LRUCache
+
+
+class DedupeBackend(Protocol):
+    async def mark_seen(self, key: str) -> bool:
+        """Marca a chave; retorna True se ela já havia sido vista na janela."""
+        ...
+
+    async def forget(self, key: str) -> None:
+        """Remove a chave, liberando uma nova entrega da mesma mensagem."""
+        ...
+
+    async def close(self) -> None: ...
+
+
+class MemoryDedupeBackend:
+    def __init__(self, maxsize: int, ttl: int):
+        self._seen: LRUCache[str, bool] = LRUCache(maxsize=maxsize, ttl=ttl)
+
+    async def mark_seen(self, key: str) -> bool:
+        if key in self._seen:
+            return True
+        self._seen.set(key, True)
+        return False
+
+    async def forget(self, key: str) -> None:
+        self._seen.pop(key)
+
+    async def close(self) -> None:
+        self._seen.clear()
+
+
+class RedisDedupeBackend:
+    """Janela compartilhada entre réplicas via `SET NX EX` no Redis."""
+
+    def __init__(self, url: str, ttl: int):
+        import redis.asyncio as redis
+
+        self._redis = redis.from_url(url)
+        self.ttl = ttl
+
+    async def mark_seen(self, key: str) -> bool:
+        created = await self._redis.set(f"dragon:dedupe:{key}", 1, nx=True, ex=self.ttl)
+        return not created
+
+    async def forget(self, key: str) -> None:
+        await self._redis.delete(f"dragon:dedupe:{key}")
+
+    async def close(self) -> None:
+        await self._redis.aclose()
+
+
+class WebhookDeduplicator:
+    """
+    Descarta webhooks repetidos da Evolution (retentativas e MESSAGES_UPSERT
+    duplicados) antes do dispatch, usando (instância, id da mensagem).
+    """
+
+    def __init__(self):
+        self.backend: DedupeBackend = self._build_backend()
+        self._checked = 0
+        self._duplicates = 0
+        self._errors = 0
+
+    def _build_backend(self) -> DedupeBackend:
+        if settings.DEDUPE_REDIS_URL:
+            try:
+                return RedisDedupeBackend(
+                    settings.DEDUPE_REDIS_URL, settings.DEDUPE_TTL
+                )
+            except ImportError:
+                logger.warning(
+                    "Deduplicator: pacote 'redis' não instalado. Usando memória local."
+                )
+        return MemoryDedupeBackend(settings.DEDUPE_MAX_SIZE, settings.DEDUPE_TTL)
+
+    async def is_duplicate(self, instance: str, message_id: Optional[str]) -> bool:
+        if not message_id:
+            return False
+
+        self._checked += 1
+        try:
+            duplicate = await self.backend.mark_seen(f"{instance}:{message_id}")
+        except Exception as e:
+            self._errors += 1
+            logger.warning(f"Deduplicator: falha no backend, liberando mensagem: {e}")
+            return False
+
+        if duplicate:
+            self._duplicates += 1
+        return duplicate
+
+    async def forget(self, instance: str, message_id: Optional[str]) -> None:
+        """Desfaz a marcação de uma mensagem que não chegou a ser processada."""
+        if not message_id:
+            return
+        try:
+            await self.backend.forget(f"{instance}:{message_id}")
+        except Exception as e:
+            self._errors += 1
+            logger.warning(f"Deduplicator: falha ao liberar {message_id}: {e}")
+
+    async def close(self) -> None:
+        await self.backend.close()
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "backend": type(self.backend).__name__,
+            "checked": self._checked,
+            "duplicates": self._duplicates,
+            "errors": self._errors,
+        }
+
+
+webhook_deduplicator = WebhookDeduplicator()
+metrics_registry.register("webhook_dedupe", webhook_deduplicator.stats)
@@ -0,0 +1,106 @@
+import asyncio
+import multiprocessing
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional
+
+from imagehash import ImageHash
+from loguru import logger
+
+from app.kernel.config import settings
+from app.kernel.core.registry import metrics_registry
+from app.kernel.utils.image import calculate_phash, get_hash_from_bytes
+
+
+class ImageHashQueueFullError(Exception):
+    """Fila de hashing cheia: a requisição foi rejeitada por backpressure."""
+
+
+class ImageHashService:
+    """
+    Executa o decode (PIL) e o pHash fora do event loop.
+    A quantidade de trabalhos pendentes é limitada; quando a fila está cheia o
+    chamador espera até `IMAGE_HASH_QUEUE_TIMEOUT` e depois é rejeitado.
+    """
+
+    def __init__(self):
+        self.kind = settings.IMAGE_HASH_EXECUTOR
+        self.workers = settings.IMAGE_HASH_WORKERS
+        self.max_pending = settings.IMAGE_HASH_MAX_PENDING
+        self._executor: Optional[Executor] = None
+        self._slots = asyncio.Semaphore(self.max_pending)
+        self._pending = 0
+        self._completed = 0
+        self._rejected = 0
+
+    def start(self) -> None:
+        if self._executor is not None:
+            return
+
+        if self.kind == "process":
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.workers,
+                mp_context=multiprocessing.get_context("forkserver"),
+            )
+        else:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.workers, thread_name_prefix="image-hash"
+            )
+        logger.info(
+            f"[ImageHash] Pool '{self.kind}' iniciado com {self.workers} workers."
+        )
+
+    async def shutdown(self) -> None:
+        if self._executor is None:
+            return
+        executor, self._executor = self._executor, None
+        await asyncio.to_thread(executor.shutdown, wait=True, cancel_futures=True)
+
+    async def _submit(
+        self, fn: Callable[..., Any], *args: Any, timeout: Optional[float]
+    ) -> Any:
+        self.start()
+        try:
+            async with asyncio.timeout(timeout):
+                await self._slots.acquire()
+        except TimeoutError:
+            self._rejected += 1
+            raise ImageHashQueueFullError(
+                f"{self._pending} trabalhos pendentes (limite {self.max_pending})"
+            )
+
+        self._pending += 1
+        try:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self._executor, fn, *args)
+        finally:
+            self._pending -= 1
+            self._completed += 1
+            self._slots.release()
+
+    async def hash_bytes(self, data: bytes) -> Optional[ImageHash]:
+        """pHash de uma mídia recebida; retorna None se a fila estiver cheia."""
+        try:
+            return await self._submit(
+                get_hash_from_bytes, data, timeout=settings.IMAGE_HASH_QUEUE_TIMEOUT
+            )
+        except ImageHashQueueFullError as e:
+            logger.warning(f"[ImageHash] Hash descartado por backpressure: {e}")
+            return None
+
+    async def phash_hex(self, data: bytes) -> str:
+        """pHash em hexadecimal para padrões enviados pelo painel (aguarda vaga)."""
+        return await self._submit(calculate_phash, data, timeout=None)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "executor": self.kind,
+            "workers": self.workers,
+            "pending": self._pending,
+            "max_pending": self.max_pending,
+            "completed": self._completed,
+            "rejected": self._rejected,
+        }
+
+
+image_hasher = ImageHashService()
+metrics_registry.register("image_hasher", image_hasher.stats)
@@ -0,0 +1,55 @@
+from typing import Optional
+
+from loguru import logger
+
+from app.kernel.config import settings
+from ..network import BaseHttpClient
+
+
+class MediaTooLargeError(Exception):
+    """A mídia excedeu o limite de bytes permitido para download."""
+
+
+class MediaClient(BaseHttpClient):
+    """
+    Downloader de mídia com pool de conexões compartilhado.
+    Lê a resposta em streaming e aborta assim que o limite de tamanho é
+    ultrapassado, devolvendo os bytes crus (sem base64).
+    """
+
+    def __init__(self):
+        super().__init__(
+            base_url="",
+            max_concurrent=settings.MEDIA_MAX_CONCURRENT,
+            timeout=settings.MEDIA_TIMEOUT,
+            retry_attempts=2,
+        )
+
+    async def _download(self, url: str, max_bytes: int) -> bytes:
+        client = await self.get_http_client()
+        async with client.stream("GET", url) as response:
+            response.raise_for_status()
+
+            declared = int(response.headers.get("content-length") or 0)
+            if declared > max_bytes:
+                raise MediaTooLargeError(f"{declared} bytes (limite {max_bytes})")
+
+            buffer = bytearray()
+            async for chunk in response.aiter_bytes():
+                buffer.extend(chunk)
+                if len(buffer) > max_bytes:
+                    raise MediaTooLargeError(f"> {max_bytes} bytes")
+            return bytes(buffer)
+
+    async def fetch_bytes(
+        self, url: str, max_bytes: Optional[int] = None
+    ) -> Optional[bytes]:
+        """Baixa a mídia da URL; retorna None em caso de erro ou excesso de tamanho."""
+        max_bytes = max_bytes or settings.MEDIA_MAX_BYTES
+        try:
+            return await self._call(url, self._download, url, max_bytes)
+        except MediaTooLargeError as e:
+            logger.warning(f"Mídia ignorada por exceder o tamanho máximo {url}: {e}")
+        except Exception as e:
+            logger.error(f"Erro ao baixar mídia da URL {url}: {e}")
+        return None
@@ -0,0 +1,90 @@
+import json
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from imagehash import ImageHash, hex_to_hash
+from loguru import logger
+
+from app.kernel.config import settings
+from app.kernel.core.registry import metrics_registry
+from app.kernel.utils.cache import LRUCache
+
+
+class PerceptualHashCache:
+    """
+    Cache endereçado por conteúdo dos pHashes de imagens/figurinhas recebidas.
+    A chave é o SHA do arquivo informado pela Evolution (ou a URL da mídia),
+    então a mesma figurinha encaminhada em vários grupos é decodificada uma vez.
+    """
+
+    def __init__(self):
+        self._cache: LRUCache[str, str] = LRUCache(
+            maxsize=settings.PHASH_CACHE_SIZE, ttl=settings.PHASH_CACHE_TTL
+        )
+        self.path: Optional[Path] = (
+            Path(settings.SETTINGS_PATH) / "cache" / "phash_cache.json"
+            if settings.PHASH_CACHE_PERSIST
+            else None
+        )
+        self._compute_seconds = 0.0
+        self._computed = 0
+
+    def get(self, key: Optional[str]) -> Optional[ImageHash]:
+        if not key:
+            return None
+        value = self._cache.get(key)
+        return hex_to_hash(value) if value else None
+
+    def set(self, key: Optional[str], image_hash: ImageHash) -> None:
+        if key:
+            self._cache.set(key, str(image_hash))
+
+    def record_compute(self, seconds: float) -> None:
+        """Registra o custo de um decode + pHash feito por falta no cache."""
+        self._compute_seconds += seconds
+        self._computed += 1
+
+    def stats(self) -> Dict[str, Any]:
+        stats = self._cache.stats()
+        avg = self._compute_seconds / self._computed if self._computed else 0.0
+        stats["avg_compute_ms"] = round(avg * 1000, 3)
+        stats["estimated_cpu_saved_s"] = round(avg * self._cache.hits, 3)
+        return stats
+
+    def load(self) -> None:
+        """Aquece o cache a partir do snapshot em disco, se existir."""
+        if not self.path or not self.path.exists():
+            return
+
+        try:
+            entries = json.loads(self.path.read_text(encoding="utf-8"))
+            now = time.time()
+            for key, value, expires_at in entries:
+                if expires_at is None or expires_at > now:
+                    ttl = expires_at - now if expires_at is not None else None
+                    self._cache.set(key, value, ttl=ttl)
+            logger.info(f"[PHashCache] {len(self._cache)} hashes carregados do disco.")
+        except Exception as e:
+            logger.warning(f"[PHashCache] Falha ao carregar snapshot: {e}")
+
+    def save(self) -> None:
+        if not self.path:
+            return
+
+        try:
+            now = time.time()
+            entries = [
+                [key, value, now + remaining if remaining is not None else None]
+                for key, value, remaining in self._cache.items()
+            ]
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.path.with_suffix(".tmp")
+            tmp_path.write_text(json.dumps(entries), encoding="utf-8")
+            tmp_path.replace(self.path)
+        except Exception as e:
+            logger.warning(f"[PHashCache] Falha ao salvar snapshot: {e}")
+
+
+phash_cache = PerceptualHashCache()
+metrics_registry.register("phash_cache", phash_cache.stats)
@@ -0,0 +1,54 @@
+import time
+from typing import Any, Dict, Tuple
+
+from app.kernel.config import settings
+from app.kernel.utils.cache import LRUCache
+from .storage import StorageService
+
+
+class PresignedUrlCache:
+    """
+    URLs de acesso aos objetos do bucket, por chave.
+    Em buckets privados (BUCKET_PRIVATE) a URL assinada é reaproveitada até a
+    validade restante cair abaixo de PRESIGNED_URL_REFRESH; em buckets públicos
+    a URL é montada direto, sem assinatura.
+    """
+
+    def __init__(self, storage: StorageService):
+        self.storage = storage
+        self._cache: LRUCache[str, Tuple[str, float]] = LRUCache(
+            maxsize=settings.PRESIGNED_URL_CACHE_SIZE
+        )
+        self._signed = 0
+        self._fallbacks = 0
+
+    def public_url(self, key: str) -> str:
+        base_url = f"{settings.BUCKET_ENDPOINT.rstrip('/')}/{settings.BUCKET_NAME}"
+        return f"{base_url}/{key.lstrip('/')}"
+
+    async def get(self, key: str) -> str:
+        if not key or key.startswith(("http://", "https://")):
+            return key
+        if not settings.BUCKET_PRIVATE:
+            return self.public_url(key)
+
+        now = time.time()
+        entry = self._cache.get(key)
+        if entry and entry[1] - now > settings.PRESIGNED_URL_REFRESH:
+            return entry[0]
+
+        url = await self.storage.get_presigned_url(key, settings.PRESIGNED_URL_TTL)
+        if not url:
+            # Falha ao assinar: mantém a URL anterior enquanto ainda for válida.
+            self._fallbacks += 1
+            return entry[0] if entry and entry[1] > now else self.public_url(key)
+
+        self._signed += 1
+        self._cache.set(key, (url, now + settings.PRESIGNED_URL_TTL))
+        return url
+
+    def stats(self) -> Dict[str, Any]:
+        stats = self._cache.stats()
+        stats["signed"] = self._signed
+        stats["fallbacks"] = self._fallbacks
+        return stats
@@ -1,10 +1,80 @@
+import asyncio
+import inspect
 import aioboto3
+from aiobotocore.config import AioConfig
 from botocore.exceptions import ClientError
+from contextlib import AsyncExitStack, asynccontextmanager
 from loguru import logger
-from typing import Optional, List
+from typing import (
+    Any,
+    AsyncIterable,
+    AsyncIterator,
+    BinaryIO,
+    NamedTuple,
+    Optional,
+    List,
+    Union,
+)
 
 from app.kernel.config import settings
 
+# Limite do S3 para `delete_objects`.
+DELETE_BATCH_SIZE = 1000
+
+# bytes, arquivo síncrono/assíncrono (`read`) ou iterador assíncrono de bytes.
+Uploadable = Union[bytes, BinaryIO, AsyncIterable[bytes], Any]
+
+
+async def _read_chunks(data: Uploadable, size: int) -> AsyncIterator[bytes]:
+    if isinstance(data, (bytes, bytearray, memoryview)):
+        view = memoryview(data)
+        for start in range(0, len(view), size):
+            yield bytes(view[start : start + size])
+        return
+
+    if hasattr(data, "__aiter__"):
+        async for chunk in data:
+            yield chunk
+        return
+
+    while True:
+        if inspect.iscoroutinefunction(data.read):
+            chunk = await data.read(size)
+        else:
+            # Leitura síncrona pode tocar o disco (SpooledTemporaryFile).
+            chunk = await asyncio.to_thread(data.read, size)
+        if not chunk:
+            return
+        yield chunk
+
+
+async def _read_parts(data: Uploadable, part_size: int) -> AsyncIterator[bytes]:
+    """Reagrupa o conteúdo em partes de `part_size` (a última pode ser menor)."""
+    buffer = bytearray()
+    async for chunk in _read_chunks(data, part_size):
+        buffer += chunk
+        while len(buffer) >= part_size:
+            yield bytes(buffer[:part_size])
+            del buffer[:part_size]
+    if buffer:
+        yield bytes(buffer)
+
+
+async def _chain(*head: bytes | AsyncIterator[bytes]) -> AsyncIterator[bytes]:
+    for item in head:
+        if isinstance(item, bytes):
+            yield item
+        else:
+            async for part in item:
+                yield part
+
+
+class StorageItem(NamedTuple):
+    """Resultado de uma leitura condicional; `content` é None se não mudou."""
+
+    content: Optional[bytes]
+    etag: Optional[str]
+
 
 class StorageService:
     _instance: Optional["StorageService"] = None
@@ -21,6 +91,8 @@ class StorageService:
             return
 
         self.session = aioboto3.Session()
+        self._s3: Optional[Any] = None
+        self._exit_stack: Optional[AsyncExitStack] = None
         self.active = bool(settings.BUCKET_ENDPOINT and settings.BUCKET_ACCESS_KEY)
 
         if not self.active:
@@ -38,8 +110,23 @@ class StorageService:
             "aws_access_key_id": settings.BUCKET_ACCESS_KEY,
             "aws_secret_access_key": settings.BUCKET_SECRET_KEY,
             "region_name": settings.BUCKET_REGION or "us-east-1",
+            "config": AioConfig(
+                max_pool_connections=settings.STORAGE_MAX_POOL_CONNECTIONS
+            ),
         }
 
+    @asynccontextmanager
+    async def _client(self) -> AsyncIterator[Any]:
+        """
+        Cliente S3 compartilhado aberto no `setup()`. Fora do ciclo de vida da
+        aplicação (scripts, testes) abre um cliente temporário.
+        """
+        if self._s3 is not None:
+            yield self._s3
+            return
+        async with self.session.client(**self._get_client_args()) as s3:
+            yield s3
+
     async def setup(self):
         """
         Método de inicialização assíncrona.
@@ -49,40 +136,127 @@ class StorageService:
             return
 
         try:
-            async with self.session.client(**self._get_client_args()) as s3:
-                try:
-                    await s3.head_bucket(Bucket=settings.BUCKET_NAME)
-                    logger.info(
-                        f"StorageService: Conectado ao bucket '{settings.BUCKET_NAME}'."
-                    )
-                except ClientError:
-                    logger.info(
-                        f"StorageService: Bucket '{settings.BUCKET_NAME}' não encontrado. Criando..."
-                    )
-                    await s3.create_bucket(Bucket=settings.BUCKET_NAME)
+            self._exit_stack = AsyncExitStack()
+            self._s3 = await self._exit_stack.enter_async_context(
+                self.session.client(**self._get_client_args())
+            )
+            try:
+                await self._s3.head_bucket(Bucket=settings.BUCKET_NAME)
+                logger.info(
+                    f"StorageService: Conectado ao bucket '{settings.BUCKET_NAME}'."
+                )
+            except ClientError:
+                logger.info(
+                    f"StorageService: Bucket '{settings.BUCKET_NAME}' não encontrado. Criando..."
+                )
+                await self._s3.create_bucket(Bucket=settings.BUCKET_NAME)
         except Exception as e:
             logger.error(f"Erro ao inicializar conexão com Storage: {e}")
+            await self.close()
             self.active = False
 
+    async def close(self):
+        """Fecha o cliente compartilhado; deve ser chamado no shutdown do 'lifespan'."""
+        if self._exit_stack is None:
+            return
+        exit_stack, self._exit_stack, self._s3 = self._exit_stack, None, None
+        await exit_stack.aclose()
+
     async def upload_file(
-        self, file_name: str, data: bytes, content_type: str
+        self, file_name: str, data: Uploadable, content_type: str
     ) -> Optional[str]:
-        """Faz o upload de bytes e retorna o nome do arquivo/chave se sucesso."""
+        """
+        Faz o upload e retorna o nome do arquivo/chave se sucesso.
+        Aceita bytes, arquivos (síncronos ou assíncronos) e iteradores assíncronos
+        de bytes. Acima de STORAGE_MULTIPART_THRESHOLD o envio é feito em partes,
+        então a memória usada não depende do tamanho do arquivo.
+        """
         if not self.active:
             return None
 
+        parts = _read_parts(data, settings.STORAGE_MULTIPART_THRESHOLD)
         try:
-            async with self.session.client(**self._get_client_args()) as s3:
-                await s3.put_object(
-                    Bucket=settings.BUCKET_NAME,
-                    Key=file_name,
-                    Body=data,
-                    ContentType=content_type,
-                )
+            first = await anext(parts, b"")
+            second = await anext(parts, None)
+            async with self._client() as s3:
+                if second is None:
+                    await s3.put_object(
+                        Bucket=settings.BUCKET_NAME,
+                        Key=file_name,
+                        Body=first,
+                        ContentType=content_type,
+                    )
+                else:
+                    await self._multipart_upload(
+                        s3, file_name, content_type, _chain(first, second, parts)
+                    )
                 return file_name
         except Exception as e:
             logger.error(f"Falha no upload do arquivo '{file_name}': {e}")
             return None
+        finally:
+            await parts.aclose()
+
+    async def _multipart_upload(
+        self,
+        s3: Any,
+        file_name: str,
+        content_type: str,
+        parts: AsyncIterator[bytes],
+    ) -> None:
+        """
+        Envia as partes em paralelo (até STORAGE_MULTIPART_CONCURRENCY). A próxima
+        parte só é lida quando há vaga, limitando quantas ficam em memória.
+        Em caso de erro o upload é abortado para não deixar partes órfãs.
+        """
+        bucket = settings.BUCKET_NAME
+        upload = await s3.create_multipart_upload(
+            Bucket=bucket, Key=file_name, ContentType=content_type
+        )
+        upload_id = upload["UploadId"]
+        slots = asyncio.Semaphore(settings.STORAGE_MULTIPART_CONCURRENCY)
+        tasks: List[asyncio.Task] = []
+
+        async def send(number: int, body: bytes) -> dict:
+            try:
+                response = await s3.upload_part(
+                    Bucket=bucket,
+                    Key=file_name,
+                    UploadId=upload_id,
+                    PartNumber=number,
+                    Body=body,
+                )
+                return {"ETag": response["ETag"], "PartNumber": number}
+            finally:
+                slots.release()
+
+        try:
+            async for body in parts:
+                await slots.acquire()
+                for task in tasks:
+                    if task.done() and task.exception():
+                        slots.release()
+                        raise task.exception()
+                tasks.append(asyncio.create_task(send(len(tasks) + 1, body)))
+
+            completed = await asyncio.gather(*tasks)
+            await s3.complete_multipart_upload(
+                Bucket=bucket,
+                Key=file_name,
+                UploadId=upload_id,
+                MultipartUpload={"Parts": completed},
+            )
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            try:
+                await s3.abort_multipart_upload(
+                    Bucket=bucket, Key=file_name, UploadId=upload_id
+                )
+            except Exception as e:
+                logger.warning(f"Falha ao abortar upload de '{file_name}': {e}")
+            raise
 
     async def get_presigned_url(self, file_key: str, expires_in: int = 3600) -> str:
         """Gera uma URL temporária para acesso público ao arquivo."""
@@ -90,7 +264,7 @@ class StorageService:
             return ""
 
         try:
-            async with self.session.client(**self._get_client_args()) as s3:
+            async with self._client() as s3:
                 return await s3.generate_presigned_url(
                     "get_object",
                     Params={"Bucket": settings.BUCKET_NAME, "Key": file_key},
@@ -106,13 +280,44 @@ class StorageService:
             return False
 
         try:
-            async with self.session.client(**self._get_client_args()) as s3:
+            async with self._client() as s3:
                 await s3.delete_object(Bucket=settings.BUCKET_NAME, Key=file_key)
                 return True
         except Exception as e:
             logger.error(f"Erro ao deletar arquivo '{file_key}': {e}")
             return False
 
+    async def delete_many(self, file_keys: List[str]) -> List[str]:
+        """
+        Remove vários objetos com `delete_objects` (até 1000 chaves por requisição).
+        Retorna as chaves que não puderam ser removidas.
+        """
+        if not self.active:
+            return list(file_keys)
+
+        failed: List[str] = []
+        async with self._client() as s3:
+            for start in range(0, len(file_keys), DELETE_BATCH_SIZE):
+                chunk = file_keys[start : start + DELETE_BATCH_SIZE]
+                try:
+                    response = await s3.delete_objects(
+                        Bucket=settings.BUCKET_NAME,
+                        Delete={
+                            "Objects": [{"Key": key} for key in chunk],
+                            "Quiet": True,
+                        },
+                    )
+                    for error in response.get("Errors", []):
+                        logger.error(
+                            f"Erro ao deletar arquivo '{error.get('Key')}': "
+                            f"{error.get('Message')}"
+                        )
+                        failed.append(error.get("Key"))
+                except Exception as e:
+                    logger.error(f"Erro ao deletar lote de {len(chunk)} arquivos: {e}")
+                    failed.extend(chunk)
+        return failed
+
     async def list_all_files(self, prefix: str = "") -> List[str]:
         """Lista todas as chaves (keys) presentes no bucket com um prefixo opcional."""
         if not self.active:
@@ -120,7 +325,7 @@ class StorageService:
 
         files = []
         try:
-            async with self.session.client(**self._get_client_args()) as s3:
+            async with self._client() as s3:
                 paginator = s3.get_paginator("list_objects_v2")
                 async for page in paginator.paginate(
                     Bucket=settings.BUCKET_NAME, Prefix=prefix
@@ -138,7 +343,7 @@ class StorageService:
             return None
 
         try:
-            async with self.session.client(**self._get_client_args()) as s3:
+            async with self._client() as s3:
                 response = await s3.get_object(
                     Bucket=settings.BUCKET_NAME, Key=file_key
                 )
@@ -146,3 +351,30 @@ class StorageService:
         except Exception as e:
             logger.error(f"Erro ao obter conteúdo do arquivo '{file_key}': {e}")
             return None
+
+    async def get_item_if_changed(
+        self, file_key: str, etag: Optional[str] = None
+    ) -> Optional[StorageItem]:
+        """
+        Lê o arquivo só se o ETag remoto for diferente de `etag` (If-None-Match).
+        Retorna None se o arquivo não pôde ser lido.
+        """
+        if not self.active:
+            return None
+
+        params = {"Bucket": settings.BUCKET_NAME, "Key": file_key}
+        if etag:
+            params["IfNoneMatch"] = etag
+
+        try:
+            async with self._client() as s3:
+                response = await s3.get_object(**params)
+                return StorageItem(await response["Body"].read(), response.get("ETag"))
+        except ClientError as e:
+            if e.response.get("Error", {}).get("Code") in ("304", "NotModified"):
+                return StorageItem(None, etag)
+            logger.error(f"Erro ao obter conteúdo do arquivo '{file_key}': {e}")
+            return None
+        except Exception as e:
+            logger.error(f"Erro ao obter conteúdo do arquivo '{file_key}': {e}")
+            return None
@@ -1,6 +1,13 @@
+import asyncio
+from typing import Any, Dict, List, Optional, Set, Tuple
+
 from ..network import BaseHttpClient
 from app.kernel.config import settings
 from loguru import logger
+from .translation_cache import TranslationCache
+
+# (source, target, format) de um lote; só textos do mesmo grupo são combinados.
+BatchGroup = Tuple[str, str, str]
 
 
 class TranslateClient(BaseHttpClient):
@@ -9,6 +16,12 @@ class TranslateClient(BaseHttpClient):
         if hasattr(self, "_initialized"):
             return
 
+        self.cache = TranslationCache()
+        self._batches: Dict[BatchGroup, Dict[str, asyncio.Future]] = {}
+        self._flush_tasks: Set[asyncio.Task] = set()
+        self._requests = 0
+        self._batched_texts = 0
+
         self.active = bool(settings.TRANSLATE_URL)
         if not self.active:
             logger.warning(
@@ -38,19 +51,117 @@ class TranslateClient(BaseHttpClient):
         if not self.active or not text:
             return text
 
+        key = self.cache.key(text, source_lang, target_lang, format)
+        cached = await self.cache.get(key)
+        if cached is not None:
+            return cached
+
+        group = (source_lang, target_lang, format)
+        if settings.TRANSLATE_BATCH_WINDOW_MS > 0:
+            translated = await self._enqueue(text, group)
+        else:
+            translated = (await self._send(group, [text]))[0]
+
+        if translated is None:
+            return text
+        await self.cache.set(key, translated)
+        return translated
+
+    async def _enqueue(self, text: str, group: BatchGroup) -> Optional[str]:
+        """
+        Junta chamadas concorrentes do mesmo grupo dentro da janela de
+        TRANSLATE_BATCH_WINDOW_MS em uma única requisição com `q` em lista.
+        Textos repetidos no lote compartilham o mesmo resultado.
+        """
+        batch = self._batches.get(group)
+        if batch is None:
+            batch = self._batches[group] = {}
+            self._spawn(self._flush_later(group, batch))
+
+        future = batch.get(text)
+        if future is None:
+            future = batch[text] = asyncio.get_running_loop().create_future()
+            if len(batch) >= settings.TRANSLATE_BATCH_MAX:
+                self._batches.pop(group, None)
+                self._spawn(self._flush(group, batch))
+
+        return await asyncio.shield(future)
+
+    def _spawn(self, coro) -> None:
+        task = asyncio.create_task(coro)
+        self._flush_tasks.add(task)
+        task.add_done_callback(self._flush_tasks.discard)
+
+    async def _flush_later(
+        self, group: BatchGroup, batch: Dict[str, asyncio.Future]
+    ) -> None:
+        try:
+            await asyncio.sleep(settings.TRANSLATE_BATCH_WINDOW_MS / 1000)
+        except asyncio.CancelledError:
+            if self._batches.get(group) is batch:
+                self._batches.pop(group)
+                self._resolve(batch, {})
+            raise
+        # Se o lote já foi enviado por ter atingido o tamanho máximo, nada a fazer.
+        if self._batches.get(group) is batch:
+            self._batches.pop(group)
+            await self._flush(group, batch)
+
+    async def _flush(self, group: BatchGroup, batch: Dict[str, asyncio.Future]):
+        texts = list(batch)
+        results: Dict[str, Optional[str]] = {}
+        try:
+            results = dict(zip(texts, await self._send(group, texts)))
+        finally:
+            # Mesmo cancelado, o lote é resolvido; sem resultado vale o original.
+            self._resolve(batch, results)
+
+    @staticmethod
+    def _resolve(
+        batch: Dict[str, asyncio.Future], results: Dict[str, Optional[str]]
+    ) -> None:
+        for text, future in batch.items():
+            if not future.done():
+                future.set_result(results.get(text))
+
+    async def _send(self, group: BatchGroup, texts: List[str]) -> List[Optional[str]]:
+        source_lang, target_lang, format = group
         payload = {
-            "q": text,
+            "q": texts[0] if len(texts) == 1 else texts,
             "target": target_lang,
             "source": source_lang,
             "format": format,
         }
 
+        self._requests += 1
+        self._batched_texts += len(texts)
         try:
             response = await self.post("translate", json=payload)
-            if isinstance(response, dict) and "translatedText" in response:
-                return response["translatedText"]
-            return text
-
         except Exception as e:
-            logger.exception(f"Falha na tradução de '{text[:20]}...': {e}")
-            return text
+            logger.exception(
+                f"Falha na tradução de {len(texts)} texto(s) ('{texts[0][:20]}...'): {e}"
+            )
+            return [None] * len(texts)
+
+        translated = (
+            response.get("translatedText") if isinstance(response, dict) else None
+        )
+        if len(texts) == 1 and isinstance(translated, str):
+            return [translated]
+        if isinstance(translated, list) and len(translated) == len(texts):
+            return translated
+        return [None] * len(texts)
+
+    async def close(self):
+        self.cache.close()
+        if self.active:
+            await super().close()
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "cache": self.cache.stats(),
+            "requests": self._requests,
+            "texts_per_request": round(
+                self._batched_texts / self._requests if self._requests else 0, 2
+            ),
+        }
@@ -0,0 +1,100 @@
+import asyncio
+import hashlib
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from loguru import logger
+
+from app.kernel.config import settings
+from app.kernel.utils.cache import LRUCache
+
+
+class TranslationCache:
+    """
+    Cache de traduções em dois níveis: LRU em memória e, opcionalmente, um
+    SQLite em disco que sobrevive a reinícios. A chave é o hash do texto junto
+    dos idiomas de origem/destino e do formato.
+    """
+
+    def __init__(self):
+        self._memory: LRUCache[str, str] = LRUCache(
+            maxsize=settings.TRANSLATE_CACHE_SIZE
+        )
+        self.path: Optional[Path] = (
+            Path(settings.SETTINGS_PATH) / "cache" / "translations.sqlite3"
+            if settings.TRANSLATE_CACHE_PERSIST
+            else None
+        )
+        self._db: Optional[sqlite3.Connection] = None
+        self._db_lock = threading.Lock()
+        self._disk_hits = 0
+
+    @staticmethod
+    def key(text: str, source: str, target: str, format: str) -> str:
+        digest = hashlib.sha256(text.encode()).hexdigest()
+        return f"{digest}:{source}:{target}:{format}"
+
+    def _connection(self) -> sqlite3.Connection:
+        if self._db is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._db = sqlite3.connect(self.path, check_same_thread=False)
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS translations "
+                "(key TEXT PRIMARY KEY, text TEXT NOT NULL)"
+            )
+        return self._db
+
+    def _db_get(self, key: str) -> Optional[str]:
+        with self._db_lock:
+            row = (
+                self._connection()
+                .execute("SELECT text FROM translations WHERE key = ?", (key,))
+                .fetchone()
+            )
+        return row[0] if row else None
+
+    def _db_set(self, key: str, value: str) -> None:
+        with self._db_lock:
+            db = self._connection()
+            db.execute(
+                "INSERT OR REPLACE INTO translations (key, text) VALUES (?, ?)",
+                (key, value),
+            )
+            db.commit()
+
+    async def get(self, key: str) -> Optional[str]:
+        value = self._memory.get(key)
+        if value is not None or not self.path:
+            return value
+
+        try:
+            value = await asyncio.to_thread(self._db_get, key)
+        except sqlite3.Error as e:
+            logger.warning(f"[TranslationCache] Falha ao ler do disco: {e}")
+            return None
+        if value is not None:
+            self._disk_hits += 1
+            self._memory.set(key, value)
+        return value
+
+    async def set(self, key: str, value: str) -> None:
+        self._memory.set(key, value)
+        if not self.path:
+            return
+        try:
+            await asyncio.to_thread(self._db_set, key, value)
+        except sqlite3.Error as e:
+            logger.warning(f"[TranslationCache] Falha ao gravar em disco: {e}")
+
+    def close(self) -> None:
+        with self._db_lock:
+            if self._db is not None:
+                self._db.close()
+                self._db = None
+
+    def stats(self) -> Dict[str, Any]:
+        stats = self._memory.stats()
+        stats["disk_hits"] = self._disk_hits
+        return stats
@@ -1,14 +1,32 @@
 from .logging_config import setup_logging
-from .image import calculate_phash, get_hash_from_b64, url_to_b64
+from .image import (
+    calculate_phash,
+    get_hash_from_b64,
+    get_hash_from_bytes,
+    to_sticker_webp,
+    url_to_b64,
+    write_sticker_webp,
+    url_to_bytes,
+)
+from .audio import to_ogg_opus
 from .text import sanitize_name, add_uuid_to_filename
 from .views import setup_views
+from .cache import LRUCache
+from .regex import pattern_registry
 
 __all__ = [
     "setup_logging",
     "calculate_phash",
     "get_hash_from_b64",
+    "get_hash_from_bytes",
+    "to_sticker_webp",
+    "to_ogg_opus",
+    "write_sticker_webp",
     "url_to_b64",
+    "url_to_bytes",
     "sanitize_name",
     "add_uuid_to_filename",
     "setup_views",
+    "LRUCache",
+    "pattern_registry",
 ]
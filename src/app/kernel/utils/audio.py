@@ -0,0 +1,50 @@
+import asyncio
+import shutil
+from typing import BinaryIO
+
+from loguru import logger
+
+FFMPEG = shutil.which("ffmpeg")
+if not FFMPEG:
+    logger.warning("ffmpeg não encontrado: áudios não serão convertidos para opus.")
+
+CHUNK_SIZE = 256 * 1024
+
+
+async def to_ogg_opus(source: BinaryIO, target: BinaryIO) -> bool:
+    """
+    Converte o áudio de `source` para ogg/opus mono 48 kHz (formato de PTT do
+    WhatsApp) via ffmpeg, gravando direto em `target` (arquivo com fileno).
+    A entrada vai em blocos pelo stdin, sem carregar o arquivo na memória.
+    Retorna False se o ffmpeg não estiver disponível ou falhar.
+    """
+    if not FFMPEG:
+        return False
+
+    process = await asyncio.create_subprocess_exec(
+        FFMPEG,
+        *("-hide_banner", "-loglevel", "error", "-i", "pipe:0", "-vn"),
+        *("-ac", "1", "-ar", "48000", "-c:a", "libopus", "-b:a", "32k"),
+        *("-application", "voip", "-f", "ogg", "-y", "pipe:1"),
+        stdin=asyncio.subprocess.PIPE,
+        stdout=target,
+        stderr=asyncio.subprocess.PIPE,
+    )
+    try:
+        while chunk := await asyncio.to_thread(source.read, CHUNK_SIZE):
+            process.stdin.write(chunk)
+            await process.stdin.drain()
+        process.stdin.close()
+    except (BrokenPipeError, ConnectionResetError):
+        # O ffmpeg encerrou antes de ler tudo; o erro sai no stderr.
+        pass
+    except BaseException:
+        process.kill()
+        await process.wait()
+        raise
+
+    error = await process.stderr.read()
+    if await process.wait() != 0:
+        logger.warning(f"ffmpeg falhou ao converter áudio: {error.decode()[-300:]}")
+        return False
+    return True
@@ -1,23 +1,59 @@
 from base64 import b64decode, b64encode
 from io import BytesIO
+from shutil import copyfileobj
+from typing import BinaryIO, Optional
 
-import httpx
 from imagehash import ImageHash, hex_to_hash, phash
-from loguru import logger
 from PIL import Image
 
 
-async def url_to_b64(url: str):
-    try:
-        url = url.split("?")[0]
-        async with httpx.AsyncClient(timeout=10.0) as client:
-            response = await client.get(url)
-            response.raise_for_status()
-            encoded_string = b64encode(response.content).decode("utf-8")
-            return encoded_string
-    except Exception as e:
-        logger.error(f"Erro ao baixar imagem da URL {url}: {e}")
+STICKER_SIZE = 512
+
+
+def write_sticker_webp(source: BinaryIO, target: BinaryIO) -> None:
+    """
+    Grava em `target` a imagem de `source` como webp 512x512 (centralizada,
+    fundo transparente). Webp animado ou já no tamanho é copiado como está.
+    """
+    image = Image.open(source)
+    if image.format == "WEBP" and (
+        getattr(image, "is_animated", False)
+        or image.size == (STICKER_SIZE, STICKER_SIZE)
+    ):
+        source.seek(0)
+        copyfileobj(source, target)
+        return
+
+    image = image.convert("RGBA")
+    image.thumbnail((STICKER_SIZE, STICKER_SIZE))
+    canvas = Image.new("RGBA", (STICKER_SIZE, STICKER_SIZE), (0, 0, 0, 0))
+    canvas.paste(
+        image,
+        ((STICKER_SIZE - image.width) // 2, (STICKER_SIZE - image.height) // 2),
+    )
+    canvas.save(target, format="WEBP", quality=80)
+
+
+def to_sticker_webp(data: bytes) -> bytes:
+    """Versão em memória de `write_sticker_webp`, para mídias pequenas."""
+    buffer = BytesIO()
+    write_sticker_webp(BytesIO(data), buffer)
+    return buffer.getvalue()
+
+
+async def url_to_bytes(url: str) -> Optional[bytes]:
+    """Baixa a mídia pelo cliente compartilhado, sem codificar em base64."""
+    # Import tardio: os serviços de infraestrutura também importam utils.
+    from app.kernel.infrastructure.services import media_client
+
+    return await media_client.fetch_bytes(url.split("?")[0])
+
+
+async def url_to_b64(url: str) -> Optional[str]:
+    data = await url_to_bytes(url)
+    if data is None:
         return None
+    return b64encode(data).decode("utf-8")
 
 
 def calculate_phash(file_bytes: bytes) -> str:
@@ -27,9 +63,13 @@ def calculate_phash(file_bytes: bytes) -> str:
     return str(hash_value)
 
 
+def get_hash_from_bytes(data: bytes) -> ImageHash:
+    img = Image.open(BytesIO(data)).convert("RGB")
+    return phash(img)
+
+
 def get_hash_from_b64(b64_str: str) -> ImageHash:
     if len(b64_str) == 16:
         return hex_to_hash(b64_str)
     else:
-        img = Image.open(BytesIO(b64decode(b64_str))).convert("RGB")
-        return phash(img)
+        return get_hash_from_bytes(b64decode(b64_str))
@@ -0,0 +1,33 @@
+import re
+from typing import Any, Dict, Tuple
+
+from app.kernel.config import settings
+from app.kernel.core.registry import metrics_registry
+from .cache import LRUCache
+
+
+class PatternRegistry:
+    """
+    Registro compartilhado e limitado de regex compiladas.
+    Substitui o cache interno do módulo `re`, que é pequeno e descarta tudo
+    quando existem centenas de padrões distintos.
+    """
+
+    def __init__(self, maxsize: int):
+        self._cache: LRUCache[Tuple[str, int], re.Pattern] = LRUCache(maxsize)
+
+    def compile(self, pattern: str, flags: int = 0) -> re.Pattern:
+        """Retorna o padrão compilado; levanta `re.error` se for inválido."""
+        key = (pattern, flags)
+        compiled = self._cache.get(key)
+        if compiled is None:
+            compiled = re.compile(pattern, flags)
+            self._cache.set(key, compiled)
+        return compiled
+
+    def stats(self) -> Dict[str, Any]:
+        return self._cache.stats()
+
+
+pattern_registry = PatternRegistry(settings.REGEX_CACHE_SIZE)
+metrics_registry.register("regex_cache", pattern_registry.stats)
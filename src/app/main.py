@@ -5,7 +5,15 @@ from loguru import logger
 from app.kernel import settings
 from app.kernel.core import module_registry
 from app.kernel.api import router as api_router
-from app.kernel import storage_service
+from app.kernel import (
+    storage_service,
+    translate_service,
+    media_client,
+    phash_cache,
+    image_hasher,
+    message_dispatcher,
+    webhook_deduplicator,
+)
 from app.kernel.utils.views import setup_views
 from app.kernel.infrastructure.providers import PROVIDERS, router as providers_router
 from app.modules import setup_modules
@@ -18,6 +26,8 @@ active_modules = module_registry.get_all()
 async def lifespan(app: FastAPI):
 
     await storage_service.setup()
+    phash_cache.load()
+    image_hasher.start()
 
     for provider in PROVIDERS:
         await provider.initialize()
@@ -26,12 +36,16 @@ async def lifespan(app: FastAPI):
         await module.startup(app)
         logger.info(f"[Lifespan] Módulo '{module.name}' iniciado.")
 
+    await message_dispatcher.start()
+
     logger.info(
         "[Lifespan] Todos os módulos iniciados. "
         "Aplicação pronta para receber mensagens."
     )
     yield
 
+    await message_dispatcher.stop()
+
     for module in active_modules:
         await module.shutdown(app)
         logger.info(f"[Lifespan] Módulo '{module.name}' desligado.")
@@ -39,6 +53,13 @@ async def lifespan(app: FastAPI):
     for provider in PROVIDERS:
         await provider.close()
 
+    await media_client.close()
+    await translate_service.close()
+    await storage_service.close()
+    await webhook_deduplicator.close()
+    phash_cache.save()
+    await image_hasher.shutdown()
+
     logger.info("[Lifespan] Aplicação encerrada.")
 
 
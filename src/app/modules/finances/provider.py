@@ -11,6 +11,9 @@ class FinanceModule(BaseModule):
     def register_routes(self):
         return web_router
 
+    def accepts(self, message_type: str) -> bool:
+        return False
+
     async def handle_message(self, message: MessageData):
         pass
 
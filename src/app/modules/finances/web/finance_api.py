@@ -3,6 +3,7 @@ from time import time
 from typing import List, Optional
 from fastapi import APIRouter, Body, Depends, Header, HTTPException
 from sqlalchemy import insert, delete, select, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 from app.modules.finances.database import get_db_session
 from app.modules.finances.database.models import (
@@ -284,55 +285,99 @@ async def sync_categories(
     return {"server_id": res["results"][0]["server_id"]}
 
 
+# Campos que o app pode enviar e que sobrescrevem a transação existente.
+# date_timestamp e account_id só são gravados na criação; category_id é
+# sempre sobrescrito (ausente vira None).
+TX_UPDATABLE_FIELDS = (
+    "entity",
+    "description",
+    "amount_cents",
+    "is_deleted",
+    "importation_id",
+    "import_timestamp",
+)
+TX_UPSERT_CHUNK = 2000
+ACCOUNT_LOOKUP_CHUNK = 5000
+
+
+async def _resolve_accounts(db: AsyncSession, local_ids: set) -> dict:
+    """Mapeia local_id -> id das contas em uma consulta por bloco de ids."""
+    local_ids = sorted(i for i in local_ids if i is not None)
+    accounts = {}
+    for start in range(0, len(local_ids), ACCOUNT_LOOKUP_CHUNK):
+        chunk = local_ids[start : start + ACCOUNT_LOOKUP_CHUNK]
+        rows = await db.execute(
+            select(Account.local_id, Account.id).where(Account.local_id.in_(chunk))
+        )
+        accounts.update(rows.tuples().all())
+    return accounts
+
+
+async def _upsert_transactions(
+    db: AsyncSession, rows: List[dict], update_fields: tuple
+) -> None:
+    """INSERT ... ON CONFLICT (id) DO UPDATE em blocos de TX_UPSERT_CHUNK linhas."""
+    for start in range(0, len(rows), TX_UPSERT_CHUNK):
+        stmt = pg_insert(Transaction).values(rows[start : start + TX_UPSERT_CHUNK])
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[Transaction.id],
+            set_={field: stmt.excluded[field] for field in update_fields},
+        )
+        await db.execute(stmt)
+
+
 @router.post("/sync/transactions/batch")
 async def sync_batch_transactions(
     payload: List[dict] = Body(...),
     user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db_session),
 ):
+    accounts = await _resolve_accounts(db, {data.get("account_id") for data in payload})
+
     results = []
+    # id -> (linha a inserir, campos enviados). Ids repetidos no payload são
+    # mesclados na ordem, como se fossem aplicados um após o outro.
+    merged = {}
     for data in payload:
         tx_id = data.get("id")
         local_account_id = data.get("account_id")
-        category_id = data.get("category_id")
-
-        # Resolve Account
-        acc_query = select(Account).where(Account.local_id == local_account_id)
-        acc_result = await db.execute(acc_query)
-        account = acc_result.scalar_one_or_none()
-
-        if not account:
-            results.append({"id": tx_id, "error": f"Account {local_account_id} not found"})
+        account_id = accounts.get(local_account_id)
+        if account_id is None:
+            results.append(
+                {"id": tx_id, "error": f"Account {local_account_id} not found"}
+            )
             continue
 
-        transaction = await db.get(Transaction, tx_id)
-        if not transaction:
-            transaction = Transaction(
-                id=tx_id,
-                entity=data.get("entity", ""),
-                description=data.get("description", ""),
-                amount_cents=data.get("amount_cents", 0),
-                date_timestamp=data.get("date_timestamp", 0),
-                account_id=account.id,
-                category_id=category_id,
-                is_deleted=data.get("is_deleted", False),
-                importation_id=data.get("importation_id", "cloud_sync"),
-                import_timestamp=data.get("import_timestamp", int(time())),
-            )
-            db.add(transaction)
+        present = {field for field in TX_UPDATABLE_FIELDS if field in data}
+        if tx_id in merged:
+            row, fields = merged[tx_id]
+            row.update({field: data[field] for field in present})
+            row["category_id"] = data.get("category_id")
+            fields.update(present)
         else:
-            transaction.entity = data.get("entity", transaction.entity)
-            transaction.description = data.get("description", transaction.description)
-            transaction.amount_cents = data.get("amount_cents", transaction.amount_cents)
-            transaction.category_id = category_id
-            transaction.is_deleted = data.get("is_deleted", transaction.is_deleted)
-            transaction.importation_id = data.get(
-                "importation_id", transaction.importation_id
-            )
-            transaction.import_timestamp = data.get(
-                "import_timestamp", transaction.import_timestamp
-            )
-        results.append({"local_id": tx_id, "server_id": transaction.id})
+            row = {
+                "id": tx_id,
+                "entity": data.get("entity", ""),
+                "description": data.get("description", ""),
+                "amount_cents": data.get("amount_cents", 0),
+                "date_timestamp": data.get("date_timestamp", 0),
+                "account_id": account_id,
+                "category_id": data.get("category_id"),
+                "is_deleted": data.get("is_deleted", False),
+                "importation_id": data.get("importation_id", "cloud_sync"),
+                "import_timestamp": data.get("import_timestamp", int(time())),
+            }
+            merged[tx_id] = (row, present)
+        results.append({"local_id": tx_id, "server_id": tx_id})
+
+    # Um statement só pode atualizar as mesmas colunas em todas as linhas:
+    # agrupa pelas chaves que cada item enviou.
+    groups = {}
+    for row, present in merged.values():
+        groups.setdefault(frozenset(present), []).append(row)
+    for present, rows in groups.items():
+        update_fields = tuple(sorted(present)) + ("category_id",)
+        await _upsert_transactions(db, rows, update_fields)
 
     await db.commit()
     return {"results": results}
@@ -2,6 +2,11 @@ from app.kernel.config import Settings
 
 
 class TriggerConfig(Settings):
+    # --- PREFETCH DAS AÇÕES EXTERNAS ---
+    PREFETCH_POOL_SIZE: int = 3
+    PREFETCH_TTL: int = 15 * 60
+    PREFETCH_RETRY_DELAY: int = 30
+
     @property
     def YAML_CONFIG_PATH(self):
         return self.SETTINGS_PATH + "/triggers.yaml"
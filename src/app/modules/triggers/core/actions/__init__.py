@@ -11,22 +11,23 @@ from .external import (
     anime_api,
 )
 from .local import meme_contact
+from .prefetch import PrefetchPool, prefetched, close_prefetch_pools
 
 
 ACTION_REGISTRY = {
-    # Ações de API (Externas)
-    "cat_api": cat_api,
-    "cat_photo_api": cat_photo_api,
-    "breaking_bad": breaking_bad_api,
-    "motivacional": motivacional_api,
-    "chuck_norris": chuck_norris_api,
-    "dog_api": get_dog,
-    "advice": get_advice,
-    "bonk": get_bonk,
-    "smile": get_smile,
-    "anime_quote": anime_api,
+    # Ações de API (Externas), servidas por um buffer pré-carregado
+    "cat_api": prefetched("cat_api", cat_api),
+    "cat_photo_api": prefetched("cat_photo_api", cat_photo_api),
+    "breaking_bad": prefetched("breaking_bad", breaking_bad_api),
+    "motivacional": prefetched("motivacional", motivacional_api),
+    "chuck_norris": prefetched("chuck_norris", chuck_norris_api),
+    "dog_api": prefetched("dog_api", get_dog),
+    "advice": prefetched("advice", get_advice),
+    "bonk": prefetched("bonk", get_bonk),
+    "smile": prefetched("smile", get_smile),
+    "anime_quote": prefetched("anime_quote", anime_api),
     # Lógica Local (Meme)
     "meme_contact": meme_contact,
 }
 
-__all__ = ["ACTION_REGISTRY"]
+__all__ = ["ACTION_REGISTRY", "PrefetchPool", "close_prefetch_pools"]
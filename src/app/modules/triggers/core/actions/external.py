@@ -1,9 +1,12 @@
-import random
 from typing import Optional
-from app.kernel.infrastructure import translate_service, external_api
+from app.kernel.infrastructure import translate_service, external_api, dataset_cache
 from app.kernel.utils import url_to_b64
 from app.kernel.config import settings
 
+MOTIVACIONAL_URL = (
+    "https://raw.githubusercontent.com/devmatheusguerra/frasesJSON/master/frases.json"
+)
+
 
 async def _safe_translate(text: Optional[str]) -> str:
     if not text:
@@ -20,7 +23,8 @@ async def cat_api(*args) -> str:
     """Busca um fato sobre gatos."""
     url = "https://meowfacts.herokuapp.com/?lang=por-br"
     res = await external_api.fetch(url)
-    return await _safe_translate(res.get("data", [""])[0] if res else "Miau!")
+    facts = res.get("data") if res else None
+    return await _safe_translate(facts[0] if facts else None)
 
 
 async def breaking_bad_api(*args) -> str:
@@ -50,14 +54,11 @@ async def get_advice(*args) -> str:
 
 
 async def motivacional_api(*args) -> str:
-    """Busca uma frase motivacional de um repositório JSON e traduz."""
-    url = "https://raw.githubusercontent.com/devmatheusguerra/frasesJSON/master/frases.json"
-    data = await external_api.fetch(url)
-
-    if not data or not isinstance(data, list):
+    """Sorteia uma frase motivacional do dataset em cache e traduz."""
+    choice = await dataset_cache.random_item(MOTIVACIONAL_URL)
+    if not isinstance(choice, dict):
         return ""
 
-    choice = random.choice(data)
     frase = await _safe_translate(choice.get("frase"))
     autor = choice.get("autor", "Desconhecido")
 
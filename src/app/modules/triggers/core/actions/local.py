@@ -1,6 +1,7 @@
 import re
 from typing import Dict, Any, List
 from app.kernel.core.interfaces import MessageData
+from app.kernel.utils import pattern_registry
 
 PADRAO_DONO = r"(?i)(?:quem (?:é|e) o dono de|de quem (?:é|e))\s+(.+)"
 PADRAO_PRONOME = (
@@ -8,6 +9,9 @@ PADRAO_PRONOME = (
     r"aquele|aquela|aqueles|aquelas|isso|isto|aquilo)\s+(.*)"
 )
 
+REGEX_DONO = pattern_registry.compile(PADRAO_DONO)
+REGEX_PRONOME = pattern_registry.compile(PADRAO_PRONOME, re.IGNORECASE)
+
 MAPA_PRONOME = {
     "o": "do",
     "a": "da",
@@ -33,12 +37,12 @@ MAPA_PRONOME = {
 
 def get_meme_name(msg: str) -> str:
     """Extrai e formata o nome para o meme do 'João Dono'."""
-    match = re.search(PADRAO_DONO, msg)
+    match = REGEX_DONO.search(msg)
     if not match:
         return ""
 
     item = match.group(1).strip().replace("?", "")
-    match_artigo = re.match(PADRAO_PRONOME, item, re.IGNORECASE)
+    match_artigo = REGEX_PRONOME.match(item)
 
     if match_artigo:
         artigo = match_artigo.group(1).lower()
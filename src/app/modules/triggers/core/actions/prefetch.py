@@ -0,0 +1,128 @@
+import asyncio
+import time
+from collections import deque
+from typing import Any, Awaitable, Callable, Deque, Dict, Optional, Tuple
+
+from loguru import logger
+
+from app.kernel import metrics_registry
+from app.modules.triggers.configs import settings
+
+
+class PrefetchPool:
+    """
+    Buffer de respostas prontas de uma ação externa.
+    Cada envio consome um item do buffer e agenda a reposição em segundo plano,
+    então o usuário não espera a API (nem a tradução). Itens vencem após
+    `ttl`; se a API falhar e o buffer estiver vazio, a última resposta boa é
+    reaproveitada.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        fetch: Callable[..., Awaitable[Any]],
+        size: int = settings.PREFETCH_POOL_SIZE,
+        ttl: float = settings.PREFETCH_TTL,
+    ):
+        self.name = name
+        self.fetch = fetch
+        self.size = size
+        self.ttl = ttl
+        self._items: Deque[Tuple[float, Any]] = deque()
+        self._last: Optional[Any] = None
+        self._refill_task: Optional[asyncio.Task] = None
+        self._retry_at = 0.0
+
+        self._hits = 0
+        self._misses = 0
+        self._stale = 0
+        self._errors = 0
+
+    async def __call__(self, *args: Any) -> Any:
+        self._drop_expired()
+        if self._items:
+            _, value = self._items.popleft()
+            self._hits += 1
+            self.warm()
+            return value
+
+        self._misses += 1
+        value = await self._fetch_one()
+        self.warm()
+        if value:
+            return value
+        if self._last:
+            self._stale += 1
+            return self._last
+        return value
+
+    def warm(self) -> None:
+        """Agenda a reposição do buffer, se ainda não houver uma em andamento."""
+        if self._refill_task and not self._refill_task.done():
+            return
+        if len(self._items) >= self.size or time.monotonic() < self._retry_at:
+            return
+        self._refill_task = asyncio.create_task(
+            self._refill(), name=f"prefetch-{self.name}"
+        )
+
+    async def close(self) -> None:
+        if self._refill_task:
+            self._refill_task.cancel()
+            await asyncio.gather(self._refill_task, return_exceptions=True)
+            self._refill_task = None
+
+    async def _refill(self) -> None:
+        while len(self._items) < self.size:
+            value = await self._fetch_one()
+            if not value:
+                # Upstream fora do ar: evita tentar de novo a cada mensagem.
+                self._retry_at = time.monotonic() + settings.PREFETCH_RETRY_DELAY
+                return
+            self._items.append((time.monotonic() + self.ttl, value))
+
+    async def _fetch_one(self) -> Any:
+        try:
+            value = await self.fetch()
+        except Exception as e:
+            self._errors += 1
+            logger.warning(f"[Prefetch] Falha ao buscar '{self.name}': {e}")
+            return None
+        if value:
+            self._last = value
+        else:
+            self._errors += 1
+        return value
+
+    def _drop_expired(self) -> None:
+        now = time.monotonic()
+        while self._items and self._items[0][0] <= now:
+            self._items.popleft()
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "ready": len(self._items),
+            "hits": self._hits,
+            "misses": self._misses,
+            "stale": self._stale,
+            "errors": self._errors,
+        }
+
+
+prefetch_pools: Dict[str, PrefetchPool] = {}
+
+
+def prefetched(name: str, fetch: Callable[..., Awaitable[Any]]) -> PrefetchPool:
+    pool = prefetch_pools[name] = PrefetchPool(name, fetch)
+    return pool
+
+
+async def close_prefetch_pools() -> None:
+    await asyncio.gather(*(pool.close() for pool in prefetch_pools.values()))
+
+
+metrics_registry.register(
+    "trigger_prefetch",
+    lambda: {name: pool.stats() for name, pool in prefetch_pools.items()},
+)
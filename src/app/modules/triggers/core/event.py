@@ -3,6 +3,7 @@ from typing import Any, Awaitable, Callable, List, Union, Optional, Dict
 
 from app.kernel import MessageData, MessageType, ChatResponse
 from app.kernel import response_registry
+from .limits import TriggerRateLimiter
 from .matchers import Matcher
 from loguru import logger
 
@@ -56,6 +57,7 @@ class TriggerEvent:
         choices: Union[List[str], Callable[[MessageData], Awaitable[str]]],
         matcher: Matcher,
         action_options: Dict[str, Any] = {},
+        limiter: Optional[TriggerRateLimiter] = None,
     ):
         self.name = name
         self.chance = chance
@@ -63,12 +65,18 @@ class TriggerEvent:
         self.choices = choices
         self.matcher = matcher
         self.action_options = action_options
+        self.limiter = limiter
 
     async def is_match(self, msg_data: MessageData) -> bool:
         """Verifica se o gatilho deve ser acionado."""
+        if self.limiter and not self.limiter.allows(msg_data.number):
+            return False
         if self.chance < 1.0 and random() >= self.chance:
             return False
-        return await self.matcher.is_match(msg_data)
+        if not await self.matcher.is_match(msg_data):
+            return False
+        # Consome o cooldown/token só depois do match, antes de qualquer envio.
+        return self.limiter is None or self.limiter.acquire(msg_data.number)
 
     async def execute(self, msg_data: MessageData) -> bool:
         selected = await self._resolve_choice(msg_data)
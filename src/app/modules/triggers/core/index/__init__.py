@@ -0,0 +1,5 @@
+from .aho_corasick import AhoCorasick
+from .image_index import ImageHashIndex
+from .trigger_index import TriggerIndex
+
+__all__ = ["AhoCorasick", "ImageHashIndex", "TriggerIndex"]
@@ -0,0 +1,63 @@
+from collections import deque
+from typing import Any, Dict, Hashable, List, Set
+
+
+class AhoCorasick:
+    """Autômato Aho-Corasick: encontra todos os padrões em uma única passada."""
+
+    def __init__(self):
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._output: List[List[Hashable]] = [[]]
+        self._built = False
+
+    def add(self, pattern: str, value: Hashable) -> None:
+        """Registra um padrão; `value` é devolvido pela busca quando ele ocorre."""
+        if self._built:
+            raise RuntimeError("Autômato já compilado; crie uma nova instância.")
+
+        node = 0
+        for char in pattern:
+            nxt = self._goto[node].get(char)
+            if nxt is None:
+                nxt = len(self._goto)
+                self._goto[node][char] = nxt
+                self._goto.append({})
+                self._fail.append(0)
+                self._output.append([])
+            node = nxt
+        self._output[node].append(value)
+
+    def build(self) -> "AhoCorasick":
+        """Calcula os links de falha (BFS) e propaga as saídas."""
+        queue: deque[int] = deque(self._goto[0].values())
+
+        while queue:
+            node = queue.popleft()
+            for char, nxt in self._goto[node].items():
+                queue.append(nxt)
+                fail = self._fail[node]
+                while fail and char not in self._goto[fail]:
+                    fail = self._fail[fail]
+                self._fail[nxt] = self._goto[fail].get(char, 0)
+                if self._fail[nxt]:
+                    self._output[nxt].extend(self._output[self._fail[nxt]])
+
+        self._built = True
+        return self
+
+    def search(self, text: str) -> Set[Any]:
+        """Retorna o conjunto de valores cujos padrões aparecem em `text`."""
+        if not self._built:
+            self.build()
+
+        goto, fail, output = self._goto, self._fail, self._output
+        found: Set[Any] = set(output[0])
+        node = 0
+        for char in text:
+            while node and char not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(char, 0)
+            if output[node]:
+                found.update(output[node])
+        return found
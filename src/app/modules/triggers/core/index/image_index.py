@@ -0,0 +1,55 @@
+from typing import List
+
+import numpy as np
+from imagehash import ImageHash
+
+# Apenas hashes de 64 bits (pHash padrão, hash_size=8) cabem em um uint64.
+HASH_BITS = 64
+
+
+def hash_to_uint64(image_hash: ImageHash) -> int:
+    return int(str(image_hash), 16)
+
+
+class ImageHashIndex:
+    """
+    Índice vetorizado dos hashes de `image_similarity`.
+    Guarda os hashes empacotados em um array uint64 e resolve a distância de
+    Hamming contra todos os gatilhos com um único XOR + popcount.
+    """
+
+    def __init__(self):
+        self._hashes: List[int] = []
+        self._thresholds: List[int] = []
+        self._positions: List[int] = []
+        self._packed = np.empty(0, dtype=np.uint64)
+        self._packed_thresholds = np.empty(0, dtype=np.uint8)
+        self._packed_positions = np.empty(0, dtype=np.int64)
+
+    def __len__(self) -> int:
+        return len(self._positions)
+
+    @staticmethod
+    def supports(image_hash: ImageHash) -> bool:
+        return image_hash.hash.size == HASH_BITS
+
+    def add(self, image_hash: ImageHash, threshold: int, position: int) -> None:
+        self._hashes.append(hash_to_uint64(image_hash))
+        self._thresholds.append(threshold)
+        self._positions.append(position)
+
+    def build(self) -> "ImageHashIndex":
+        self._packed = np.array(self._hashes, dtype=np.uint64)
+        self._packed_thresholds = np.array(self._thresholds, dtype=np.uint8)
+        self._packed_positions = np.array(self._positions, dtype=np.int64)
+        return self
+
+    def query(self, image_hash: ImageHash) -> List[int]:
+        """Posições dos gatilhos cuja distância está dentro do próprio `threshold`."""
+        if not self._positions or not self.supports(image_hash):
+            return []
+
+        target = np.uint64(hash_to_uint64(image_hash))
+        distances = np.bitwise_count(np.bitwise_xor(self._packed, target))
+        hits = distances <= self._packed_thresholds
+        return self._packed_positions[hits].tolist()
@@ -0,0 +1,110 @@
+import re
+from collections import defaultdict
+from typing import Dict, List, Set
+
+from loguru import logger
+from app.kernel import MessageData
+from ..event import TriggerEvent
+from ..matchers.implementations import (
+    TextMatcher,
+    RegexMatcher,
+    ImageSimilarityMatcher,
+    resolve_image_hash,
+)
+from .aho_corasick import AhoCorasick
+from .image_index import ImageHashIndex
+
+# Padrões que dependem da numeração dos próprios grupos não podem ser unidos.
+_BACKREFERENCE = re.compile(r"\\[1-9]|\(\?P=")
+_GLOBAL_FLAGS = re.compile(r"^\(\?([aiLmsux]+)\)")
+
+
+def _scoped(pattern: str) -> str:
+    """Converte flags globais iniciais, ex. '(?i)abc', em um grupo '(?i:abc)'."""
+    flags = _GLOBAL_FLAGS.match(pattern)
+    if not flags:
+        return f"(?:{pattern})"
+    return f"(?{flags.group(1)}:{pattern[flags.end():]})"
+
+
+class TriggerIndex:
+    """
+    Índice compilado de uma lista de gatilhos.
+    Varre o corpo da mensagem uma única vez e devolve apenas os candidatos,
+    na mesma ordem de prioridade da lista original.
+    """
+
+    def __init__(self, triggers: List[TriggerEvent]):
+        self.triggers = triggers
+        self._unindexed: List[int] = []
+        self._folded = AhoCorasick()
+        self._exact = AhoCorasick()
+        self._has_folded = False
+        self._has_exact = False
+        self._regex_filters: List[tuple[re.Pattern, List[int]]] = []
+        self._images = ImageHashIndex()
+
+        regex_groups: Dict[int, List[int]] = defaultdict(list)
+        for position, trigger in enumerate(triggers):
+            matcher = trigger.matcher
+            if isinstance(matcher, TextMatcher):
+                if matcher.config.case_sensitive:
+                    self._exact.add(matcher.pattern, position)
+                    self._has_exact = True
+                else:
+                    self._folded.add(matcher.pattern, position)
+                    self._has_folded = True
+            elif isinstance(matcher, RegexMatcher) and not _BACKREFERENCE.search(
+                matcher.config.pattern
+            ):
+                regex_groups[matcher.config.flags].append(position)
+            elif isinstance(
+                matcher, ImageSimilarityMatcher
+            ) and ImageHashIndex.supports(matcher.config.hash):
+                self._images.add(
+                    matcher.config.hash, matcher.config.threshold, position
+                )
+            else:
+                self._unindexed.append(position)
+
+        self._folded.build()
+        self._exact.build()
+        self._images.build()
+        for flags, positions in regex_groups.items():
+            self._add_regex_filter(flags, positions)
+
+    def __len__(self) -> int:
+        return len(self.triggers)
+
+    def __iter__(self):
+        return iter(self.triggers)
+
+    def _add_regex_filter(self, flags: int, positions: List[int]) -> None:
+        """Une os regex de mesmas flags em uma única alternância de pré-filtro."""
+        combined = "|".join(
+            _scoped(self.triggers[p].matcher.config.pattern) for p in positions
+        )
+        try:
+            self._regex_filters.append((re.compile(combined, flags), positions))
+        except re.error as e:
+            logger.debug(f"Pré-filtro de regex indisponível ({e}); avaliando um a um.")
+            self._unindexed.extend(positions)
+
+    async def candidates(self, msg: MessageData) -> List[TriggerEvent]:
+        """Retorna os gatilhos que podem casar com a mensagem, em ordem de prioridade."""
+        body = msg.body
+        positions: Set[int] = set(self._unindexed)
+
+        if self._has_folded:
+            positions.update(self._folded.search(body.lower()))
+        if self._has_exact:
+            positions.update(self._exact.search(body))
+        for prefilter, members in self._regex_filters:
+            if prefilter.search(body):
+                positions.update(members)
+        if len(self._images) and msg.is_img:
+            msg_hash = await resolve_image_hash(msg)
+            if msg_hash is not None:
+                positions.update(self._images.query(msg_hash))
+
+        return [self.triggers[p] for p in sorted(positions)]
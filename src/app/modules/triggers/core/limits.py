@@ -0,0 +1,103 @@
+import time
+from typing import Any, Dict, Optional, Tuple
+
+from pydantic import BaseModel, Field, ValidationError, model_validator
+
+from app.kernel.utils import LRUCache
+
+# Limite de chats acompanhados por gatilho; os mais antigos são descartados.
+MAX_TRACKED_CHATS = 10_000
+
+
+class TriggerLimitsConfig(BaseModel):
+    """
+    Limites de disparo de um gatilho, configurados em `limits` no triggers.yaml.
+    - cooldown: intervalo mínimo (s) entre disparos no mesmo chat.
+    - global_cooldown: intervalo mínimo (s) entre disparos em qualquer chat.
+    - per_minute/burst: token bucket por chat (taxa de reposição e capacidade).
+    """
+
+    cooldown: float = Field(default=0, ge=0)
+    global_cooldown: float = Field(default=0, ge=0)
+    per_minute: Optional[float] = Field(default=None, gt=0)
+    burst: int = Field(default=1, ge=1)
+
+    @model_validator(mode="after")
+    def _check_burst(self):
+        if self.burst > 1 and self.per_minute is None:
+            raise ValueError("'burst' exige 'per_minute' definido.")
+        return self
+
+    @property
+    def enabled(self) -> bool:
+        return bool(self.cooldown or self.global_cooldown or self.per_minute)
+
+
+def limits_error(error: ValidationError) -> str:
+    """Resumo legível dos erros de validação de `limits`."""
+    return "; ".join(
+        (f"{'.'.join(map(str, err['loc']))}: " if err["loc"] else "")
+        + err["msg"].removeprefix("Value error, ")
+        for err in error.errors()
+    )
+
+
+class TriggerRateLimiter:
+    """
+    Controle de disparos de um gatilho com verificações O(1).
+    `allows` é uma consulta barata feita antes do matcher; `acquire` confirma o
+    disparo depois do match e consome a janela/token de forma atômica.
+    """
+
+    def __init__(self, config: TriggerLimitsConfig):
+        self.config = config
+        self._global_until = 0.0
+        self._chat_until: Optional[LRUCache[str, bool]] = None
+        self._buckets: Optional[LRUCache[str, Tuple[float, float]]] = None
+        self._refill_rate = 0.0
+
+        if config.cooldown:
+            self._chat_until = LRUCache(maxsize=MAX_TRACKED_CHATS, ttl=config.cooldown)
+        if config.per_minute:
+            self._refill_rate = config.per_minute / 60
+            # Um bucket parado até encher de novo equivale a um bucket novo.
+            self._buckets = LRUCache(
+                maxsize=MAX_TRACKED_CHATS, ttl=config.burst / self._refill_rate
+            )
+
+    @classmethod
+    def from_config(
+        cls, raw: Optional[Dict[str, Any]]
+    ) -> Optional["TriggerRateLimiter"]:
+        if not raw:
+            return None
+        config = TriggerLimitsConfig.model_validate(raw)
+        return cls(config) if config.enabled else None
+
+    def _tokens(self, chat: str, now: float) -> float:
+        state = self._buckets.get(chat)
+        if state is None:
+            return float(self.config.burst)
+        tokens, updated_at = state
+        return min(self.config.burst, tokens + (now - updated_at) * self._refill_rate)
+
+    def allows(self, chat: str) -> bool:
+        now = time.monotonic()
+        return (
+            now >= self._global_until
+            and (self._chat_until is None or chat not in self._chat_until)
+            and (self._buckets is None or self._tokens(chat, now) >= 1)
+        )
+
+    def acquire(self, chat: str) -> bool:
+        if not self.allows(chat):
+            return False
+
+        now = time.monotonic()
+        if self.config.global_cooldown:
+            self._global_until = now + self.config.global_cooldown
+        if self._chat_until is not None:
+            self._chat_until.set(chat, True)
+        if self._buckets is not None:
+            self._buckets.set(chat, (self._tokens(chat, now) - 1, now))
+        return True
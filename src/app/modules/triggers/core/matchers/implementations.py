@@ -1,34 +1,65 @@
-import re
+import time
+from typing import Optional
+from imagehash import ImageHash
+from loguru import logger
 from .schemas import (
     TextMatchConfig,
     RegexMatchConfig,
     ImageMatchConfig,
     AlwaysMatchConfig,
 )
-from app.kernel import MessageData
-from app.kernel.utils import get_hash_from_b64, url_to_b64
+from app.kernel import MessageData, pattern_registry, phash_cache, image_hasher
+from app.kernel.utils import url_to_bytes
 
 
 class TextMatcher:
     def __init__(self, config: dict):
         self.config = TextMatchConfig(**config)
-
-    async def is_match(self, msg: MessageData) -> bool:
-        body = msg.body if self.config.case_sensitive else msg.body.lower()
-        pattern = (
+        self.pattern = (
             self.config.pattern
             if self.config.case_sensitive
             else self.config.pattern.lower()
         )
-        return pattern in body
+
+    async def is_match(self, msg: MessageData) -> bool:
+        body = msg.body if self.config.case_sensitive else msg.body.lower()
+        return self.pattern in body
 
 
 class RegexMatcher:
     def __init__(self, config: dict):
         self.config = RegexMatchConfig(**config)
+        self.regex = pattern_registry.compile(self.config.pattern, self.config.flags)
 
     async def is_match(self, msg: MessageData) -> bool:
-        return bool(re.search(self.config.pattern, msg.body, self.config.flags))
+        return bool(self.regex.search(msg.body))
+
+
+async def resolve_image_hash(msg: MessageData) -> Optional[ImageHash]:
+    """Calcula (uma vez por mensagem) o pHash da imagem/figurinha recebida."""
+    if msg.cached_hash is not None:
+        return msg.cached_hash
+
+    url = msg.body.split(" |&&| ")[0] if " |&&| " in msg.body else msg.body
+    cache_key = msg.media_key or (url if url.startswith("http") else None)
+    msg.cached_hash = phash_cache.get(cache_key)
+    if msg.cached_hash is not None:
+        return msg.cached_hash
+
+    if not msg.cached_media and url.startswith("http"):
+        msg.cached_media = await url_to_bytes(url)
+    if msg.cached_media:
+        started = time.perf_counter()
+        try:
+            msg.cached_hash = await image_hasher.hash_bytes(msg.cached_media)
+        except Exception as e:
+            # Mídia corrompida não pode derrubar os demais gatilhos da mensagem.
+            logger.warning(f"Falha ao calcular o pHash da mídia {cache_key}: {e}")
+            return None
+        if msg.cached_hash is not None:
+            phash_cache.record_compute(time.perf_counter() - started)
+            phash_cache.set(cache_key, msg.cached_hash)
+    return msg.cached_hash
 
 
 class ImageSimilarityMatcher:
@@ -39,17 +70,11 @@ class ImageSimilarityMatcher:
         if not msg.is_img:
             return False
 
-        if msg.cached_hash is None:
-            if not msg.cached_b64:
-                url = msg.body.split(" |&&| ")[0] if " |&&| " in msg.body else msg.body
-                if url.startswith("http"):
-                    msg.cached_b64 = await url_to_b64(url)
-            if msg.cached_b64:
-                msg.cached_hash = get_hash_from_b64(msg.cached_b64)
-        if msg.cached_hash is None:
+        msg_hash = await resolve_image_hash(msg)
+        if msg_hash is None:
             return False
 
-        return (msg.cached_hash - self.config.hash) <= self.config.threshold
+        return (msg_hash - self.config.hash) <= self.config.threshold
 
 
 class AlwaysMatcher:
@@ -1,7 +1,8 @@
 import re
-from pydantic import BaseModel, ConfigDict, Field, field_validator
+from pydantic import BaseModel, ConfigDict, Field, field_validator, model_validator
 from typing import Any
 from imagehash import ImageHash, hex_to_hash
+from app.kernel import pattern_registry
 
 
 class TextMatchConfig(BaseModel):
@@ -13,6 +14,14 @@ class RegexMatchConfig(BaseModel):
     pattern: str
     flags: int = re.IGNORECASE
 
+    @model_validator(mode="after")
+    def validate_pattern(self) -> "RegexMatchConfig":
+        try:
+            pattern_registry.compile(self.pattern, self.flags)
+        except re.error as e:
+            raise ValueError(f"Regex inválida '{self.pattern}': {e}") from e
+        return self
+
 
 class ImageMatchConfig(BaseModel):
     model_config = ConfigDict(arbitrary_types_allowed=True)
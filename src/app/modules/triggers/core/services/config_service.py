@@ -1,3 +1,4 @@
+import os
 import yaml
 from pathlib import Path
 from typing import Any, Dict
@@ -38,9 +39,13 @@ class ConfigService:
 
     def save_triggers_data(self, data: Dict[str, Any]) -> bool:
         """Salva as alterações vindas do Dashboard de volta no YAML."""
+        # Grava em arquivo temporário e troca de uma vez, para que um reload
+        # concorrente nunca leia o YAML pela metade.
+        tmp_path = self.yaml_path.with_suffix(".yaml.tmp")
         try:
-            with open(self.yaml_path, "w", encoding="utf-8") as f:
+            with open(tmp_path, "w", encoding="utf-8") as f:
                 yaml.dump(data, f, allow_unicode=True, sort_keys=False)
+            os.replace(tmp_path, self.yaml_path)
             return True
         except Exception:
             return False
@@ -1,15 +1,36 @@
+import asyncio
 import yaml
 from pathlib import Path
-from typing import Any, Dict, List, Tuple
+from random import choice
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+)
 from loguru import logger
+from pydantic import ValidationError
 import json
 
 from app.modules.triggers.configs import settings
-from ..actions import ACTION_REGISTRY
+from ..actions import ACTION_REGISTRY, PrefetchPool
 from ..matchers import MATCHER_REGISTRY
-from app.kernel.infrastructure import storage_service
+from app.kernel import MessageData
+from app.kernel.infrastructure import (
+    asset_cache,
+    asset_pipeline,
+    presigned_urls,
+    storage_service,
+)
 
 from ..event import TriggerEvent
+from ..limits import TriggerRateLimiter, limits_error
+from ..index import TriggerIndex
 
 
 class TriggerFactory:
@@ -19,37 +40,91 @@ class TriggerFactory:
         """
         self.storage = storage_service
         self.yaml_path = Path(settings.SETTINGS_PATH) / "triggers.yaml"
-        self.bucket_url = (
-            f'{settings.BUCKET_ENDPOINT.rstrip("/")}/{settings.BUCKET_NAME.rstrip("/")}'
-        )
-
-    async def load_triggers(self) -> Tuple[List[TriggerEvent], List[TriggerEvent]]:
+        # Eventos já construídos: chave da regra -> (fingerprint, evento).
+        self._built: Dict[str, Tuple[str, TriggerEvent]] = {}
+        # Leituras do storage em andamento na carga atual, por chave de arquivo.
+        self._inflight: Dict[str, asyncio.Task] = {}
+        self._storage_slots = asyncio.Semaphore(settings.STORAGE_PREFETCH_CONCURRENCY)
+        # Variantes convertidas no upload (assets/derived/) presentes no bucket.
+        self._derived: Set[str] = set()
+
+    async def load_triggers(self) -> Tuple[TriggerIndex, TriggerIndex]:
         if not self.yaml_path.exists():
             logger.warning(
                 f"Arquivo de configuração '{self.yaml_path}' não encontrado. Nenhuma trigger carregada."
             )
-            return [], []
+            return TriggerIndex([]), TriggerIndex([])
 
         with open(self.yaml_path, "r", encoding="utf-8") as f:
             config = yaml.safe_load(f) or {}
 
-        triggers = await self._build_list(config.get("triggers", []))
-        no_triggers = await self._build_list(config.get("no_triggers", []))
+        built: Dict[str, Tuple[str, TriggerEvent]] = {}
+        self._derived = await asset_pipeline.available()
+        try:
+            triggers, no_triggers = await asyncio.gather(
+                self._build_list(config.get("triggers", []), "triggers", built),
+                self._build_list(config.get("no_triggers", []), "no_triggers", built),
+            )
+        finally:
+            self._inflight.clear()
+
+        reused = sum(1 for key, entry in built.items() if self._built.get(key) == entry)
+        self._built = built
         logger.info(
-            f"Carregados {len(triggers)} triggers e {len(no_triggers)} no_triggers."
+            f"Carregados {len(triggers)} triggers e {len(no_triggers)} no_triggers "
+            f"({reused} reaproveitados, {len(built) - reused} construídos)."
+        )
+        return (TriggerIndex(triggers), TriggerIndex(no_triggers))
+
+    async def _build_list(
+        self,
+        items: List[Dict[str, Any]],
+        section: str,
+        built: Dict[str, Tuple[str, TriggerEvent]],
+    ) -> List[TriggerEvent]:
+        """
+        Constrói os eventos de uma seção em paralelo, reaproveitando os que não
+        mudaram desde a última carga (mesmo id e mesmo conteúdo), junto das
+        choices já lidas do storage e do estado dos limites de disparo.
+        """
+        plan = []
+        keys: Set[str] = set()
+        for position, item in enumerate(items):
+            fingerprint = json.dumps(item, sort_keys=True, default=str)
+            key = f"{section}:{item.get('id') or position}"
+            if key in keys:
+                key = f"{key}:{position}"
+            keys.add(key)
+
+            previous = self._built.get(key)
+            reusable = previous[1] if previous and previous[0] == fingerprint else None
+            plan.append((key, fingerprint, item, reusable))
+
+        async def build(item: Dict[str, Any], reusable: Optional[TriggerEvent]):
+            return reusable or await self._create_trigger(item)
+
+        results = await asyncio.gather(
+            *(build(item, reusable) for _, _, item, reusable in plan)
         )
-        return (triggers, no_triggers)
 
-    async def _build_list(self, items: List[Dict[str, Any]]) -> List[TriggerEvent]:
         events = []
-        for item in items:
-            event = await self._create_trigger(item)
+        for (key, fingerprint, _, _), event in zip(plan, results):
             if event:
+                built[key] = (fingerprint, event)
                 events.append(event)
         return events
 
     async def _create_trigger(self, item: Dict[str, Any]) -> TriggerEvent | None:
         try:
+            try:
+                limiter = TriggerRateLimiter.from_config(item.get("limits"))
+            except ValidationError as e:
+                logger.error(
+                    f"Trigger '{item.get('name')}' descartado: limits inválidos "
+                    f"({limits_error(e)})."
+                )
+                return None
+
             matcher_type = MATCHER_REGISTRY.get(item.get("matcher", "always"))
             if not matcher_type:
                 logger.error(
@@ -61,6 +136,8 @@ class TriggerFactory:
             action_name = item.get("action")
             if action_name in ACTION_REGISTRY:
                 choices = ACTION_REGISTRY[action_name]
+                if isinstance(choices, PrefetchPool):
+                    choices.warm()
             else:
                 choices = await self._resolve_choices(item)
 
@@ -70,12 +147,15 @@ class TriggerFactory:
                 action_type=item.get("type", "send_text"),
                 choices=choices,
                 matcher=matcher,
+                limiter=limiter,
             )
-        except Exception as e:
-            logger.error(f"Erro ao criar trigger {item.get('name')}: {e}")
+        except Exception:
+            logger.exception(f"Trigger '{item.get('name')}' descartado: erro ao criar.")
             return None
 
-    async def _resolve_choices(self, item: Dict[str, Any]) -> List[Any]:
+    async def _resolve_choices(
+        self, item: Dict[str, Any]
+    ) -> Union[List[Any], Callable[[MessageData], Awaitable[str]]]:
         """Resolve se o conteúdo vem de arquivo, URL do bucket ou valor direto."""
         action_type = item.get("type", "")
         files = item.get("files", [])
@@ -84,32 +164,42 @@ class TriggerFactory:
             return value
 
         if action_type in ["send_audio", "send_sticker", "send_image"]:
-            return [self._format_url(f) for f in files]
-
-        choices = []
-        for file in files:
-            if file.lower().endswith((".jpg", ".png", ".mp3", ".ogg", ".webp")):
-                continue
+            return self._media_choices(files, action_type)
 
-            content = await self._read_from_storage(file)
-            choices.extend(content)
+        text_files = [
+            file
+            for file in files
+            if not file.lower().endswith((".jpg", ".png", ".mp3", ".ogg", ".webp"))
+        ]
+        contents = await asyncio.gather(*map(self._read_from_storage, text_files))
+        choices = [line for content in contents for line in content]
 
         return choices or value
 
-    def _format_url(self, path: str) -> str:
+    def _media_choices(
+        self, files: List[str], action_type: str
+    ) -> Callable[[MessageData], Awaitable[str]]:
+        """
+        Sorteia o arquivo e resolve a URL no envio (assinada, se o bucket for
+        privado), preferindo a variante já convertida no upload quando existe.
+        """
+        kind = action_type.removeprefix("send_")
+        keys = []
+        for file in files:
+            derived = asset_pipeline.derived_key(file, kind)
+            keys.append(derived if derived in self._derived else file)
 
-        if not path or path.startswith(("http://", "https://")):
-            return path
-        clean_path = path.lstrip("/")
-        base_url = self.bucket_url.rstrip("/")
-        return f"{base_url}/{clean_path}"
+        async def resolve(msg_data: MessageData) -> str:
+            return await presigned_urls.get(choice(keys))
+
+        return resolve
 
     async def _read_from_storage(self, filename: str) -> List[str]:
         if not filename:
             return []
 
         try:
-            response = await storage_service.get_item_content(file_key=filename)
+            response = await self._fetch(filename)
             if not response:
                 logger.warning(f"Arquivo '{filename}' não encontrado no storage.")
                 return []
@@ -127,5 +217,17 @@ class TriggerFactory:
             logger.warning(f"Falha ao ler arquivo '{filename}' no storage: {e}")
             return []
 
+    async def _fetch(self, filename: str) -> Optional[bytes]:
+        """Uma única leitura por arquivo na carga, mesmo se vários gatilhos o usam."""
+        task = self._inflight.get(filename)
+        if task is None:
+            task = asyncio.ensure_future(self._download(filename))
+            self._inflight[filename] = task
+        return await task
+
+    async def _download(self, filename: str) -> Optional[bytes]:
+        async with self._storage_slots:
+            return await asset_cache.get(filename)
+
 
 service_factory = TriggerFactory(storage_service)
@@ -1,7 +1,9 @@
-from typing import List, Optional
+import asyncio
+from typing import Optional, Tuple
 from loguru import logger
 from app.kernel import MessageData
-from .core.event import TriggerEvent
+from .core.index import TriggerIndex
+from .core.services.factory import service_factory
 
 
 class TriggerManager:
@@ -17,21 +19,49 @@ class TriggerManager:
         if self._initialized:
             return
 
-        self.primary_triggers: List[TriggerEvent] = []
-        self.fallback_triggers: List[TriggerEvent] = []
+        # (primary, fallback) trocados juntos em uma única atribuição.
+        self._indexes: Tuple[TriggerIndex, TriggerIndex] = (
+            TriggerIndex([]),
+            TriggerIndex([]),
+        )
+        self._reload_lock = asyncio.Lock()
 
         self._initialized = True
         logger.info("TriggerManager inicializado como Singleton.")
 
+    @property
+    def primary_triggers(self) -> TriggerIndex:
+        return self._indexes[0]
+
+    @property
+    def fallback_triggers(self) -> TriggerIndex:
+        return self._indexes[1]
+
+    async def reload(self) -> None:
+        """
+        Recarrega o triggers.yaml sem reiniciar o processo. Regras inalteradas são
+        reaproveitadas pela factory; mensagens em andamento terminam com os
+        índices antigos e as próximas já usam os novos.
+        """
+        async with self._reload_lock:
+            self._indexes = await service_factory.load_triggers()
+
     async def process(self, msg_data: MessageData) -> None:
-        if await self._run_events(self.primary_triggers, msg_data, "Primary"):
+        primary, fallback = self._indexes
+        if await self._run_events(primary, msg_data, "Primary"):
             return
-        await self._run_events(self.fallback_triggers, msg_data, "Fallback")
+        await self._run_events(fallback, msg_data, "Fallback")
 
     async def _run_events(
-        self, triggers: List[TriggerEvent], msg: MessageData, label: str
+        self, triggers: TriggerIndex, msg: MessageData, label: str
     ) -> bool:
-        for trigger in triggers:
+        try:
+            candidates = await triggers.candidates(msg)
+        except Exception as e:
+            logger.error(f"[{label}] Erro ao consultar o índice de gatilhos: {e}")
+            return False
+
+        for trigger in candidates:
             try:
                 if await trigger.is_match(msg):
                     if await trigger.execute(msg):
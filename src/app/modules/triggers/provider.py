@@ -1,7 +1,7 @@
 from app.kernel import MessageData, BaseModule
 from .manager import trigger_manager
 from .web import web_router
-from .core.services.factory import service_factory
+from .core.actions import close_prefetch_pools
 
 
 class TriggersModule(BaseModule):
@@ -16,9 +16,7 @@ class TriggersModule(BaseModule):
         await trigger_manager.process(message)
 
     async def startup(self, app):
-        triggers, no_triggers = await service_factory.load_triggers()
-        trigger_manager.primary_triggers = triggers
-        trigger_manager.fallback_triggers = no_triggers
+        await trigger_manager.reload()
 
     async def shutdown(self, app):
-        pass
+        await close_prefetch_pools()
@@ -1,13 +1,31 @@
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, ValidationError, model_validator
 from typing import List, Optional, Dict, Any
 from fastapi import UploadFile
 
+from ..core.limits import TriggerLimitsConfig, limits_error
+
 
 class TriggerParams(BaseModel):
     pattern: Optional[str] = None
     hash: Optional[str] = None
 
 
+class TriggerLimits(BaseModel):
+    cooldown: Optional[float] = None
+    global_cooldown: Optional[float] = None
+    per_minute: Optional[float] = None
+    burst: Optional[int] = None
+
+    @model_validator(mode="after")
+    def _check_limits(self):
+        """Mesmas regras aplicadas na carga do triggers.yaml."""
+        try:
+            TriggerLimitsConfig.model_validate(self.model_dump(exclude_none=True))
+        except ValidationError as e:
+            raise ValueError(limits_error(e)) from None
+        return self
+
+
 class TriggerRule(BaseModel):
     id: str
     name: str
@@ -15,6 +33,7 @@ class TriggerRule(BaseModel):
     matcher: str = "always"
     chance: float = 1.0
     params: TriggerParams = Field(default_factory=TriggerParams)
+    limits: Optional[TriggerLimits] = None
     action: Optional[str] = None
     value: Optional[str] = None
     existing_files: List[str] = []
@@ -1,5 +1,8 @@
 from fastapi import APIRouter, HTTPException
+from pydantic import ValidationError
+from app.modules.triggers.core.limits import TriggerLimitsConfig, limits_error
 from app.modules.triggers.core.services.config_service import config_service
+from app.modules.triggers.manager import trigger_manager
 
 router = APIRouter(prefix="/api/internal", tags=["Trigger Config API"])
 
@@ -16,7 +19,18 @@ async def get_config():
 
 @router.post("/config")
 async def update_config(data: dict):
+    for item in data.get("triggers", []) + data.get("no_triggers", []):
+        try:
+            TriggerLimitsConfig.model_validate(item.get("limits") or {})
+        except ValidationError as e:
+            raise HTTPException(
+                status_code=422,
+                detail=f"Limites inválidos no gatilho '{item.get('name')}': "
+                f"{limits_error(e)}",
+            )
+
     success = config_service.save_triggers_data(data)
     if not success:
         raise HTTPException(status_code=500, detail="Erro ao salvar configuração")
+    await trigger_manager.reload()
     return {"status": "success"}
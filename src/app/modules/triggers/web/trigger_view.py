@@ -1,10 +1,13 @@
+import asyncio
 from typing import List
 from fastapi import APIRouter, BackgroundTasks, Depends, Request, UploadFile
 from fastapi.responses import HTMLResponse, RedirectResponse
 from app.modules.triggers.core.services.config_service import config_service
 from app.modules.triggers.configs import settings
-from app.kernel import storage_service
-from app.kernel import add_uuid_to_filename, calculate_phash
+from app.kernel import asset_pipeline, storage_service
+from app.kernel import add_uuid_to_filename, image_hasher
+from app.kernel.infrastructure.services.asset_pipeline import DERIVED_FORMATS
+from app.modules.triggers.manager import trigger_manager
 from .utils.RuleFormParser import RuleFormParser, TriggerRule
 
 
@@ -44,27 +47,34 @@ async def save_config(
     for rule in rules:
         if rule.matcher == "image_similarity":
             if rule.trigger_upload:
-
                 rule.params.pattern = await upload_to_storage(
                     rule.trigger_upload, "triggers"
                 )
                 await rule.trigger_upload.seek(0)
-                rule.params.hash = calculate_phash(await rule.trigger_upload.read())
+                rule.params.hash = await image_hasher.phash_hex(
+                    await rule.trigger_upload.read()
+                )
             used_files.add(rule.params.pattern)
 
+        kind = rule.type.removeprefix("send_")
         for f in rule.new_files:
             path = await upload_to_storage(f, "assets")
             rule.existing_files.append(path)
+            if path and kind in DERIVED_FORMATS:
+                await asset_pipeline.derive(path, f.file, kind)
 
         used_files.update(rule.existing_files)
+        derived = (asset_pipeline.derived_key(p, kind) for p in rule.existing_files)
+        used_files.update(filter(None, derived))
         if rule.matcher == "always":
             no_triggers.append(rule.dict_for_yaml())
         else:
             triggers.append(rule.dict_for_yaml())
 
-    config_service.save_triggers_data(
+    if config_service.save_triggers_data(
         {"triggers": triggers, "no_triggers": no_triggers}
-    )
+    ):
+        await trigger_manager.reload()
     background_tasks.add_task(cleanup_unused_files, used_files)
     return RedirectResponse(url="/trigger-config", status_code=303)
 
@@ -79,9 +89,10 @@ async def upload_to_storage(file: UploadFile, folder: str = "assets"):
 
 
 async def cleanup_unused_files(used_files: set):
-    asset_files = await storage_service.list_all_files("assets")
-    trigger_files = await storage_service.list_all_files("triggers")
-    all_files = set(asset_files + trigger_files)
-    for f in all_files:
-        if f not in used_files:
-            await storage_service.delete_file(f)
+    asset_files, trigger_files = await asyncio.gather(
+        storage_service.list_all_files("assets"),
+        storage_service.list_all_files("triggers"),
+    )
+    unused = sorted(set(asset_files + trigger_files) - used_files)
+    if unused:
+        await storage_service.delete_many(unused)
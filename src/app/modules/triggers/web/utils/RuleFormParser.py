@@ -1,8 +1,14 @@
-from fastapi import Request
-from ..schemas import TriggerRule, TriggerParams
+from fastapi import HTTPException, Request
+from pydantic import ValidationError
+from ..schemas import TriggerRule, TriggerParams, TriggerLimits
+from ...core.limits import limits_error
 from uuid import uuid4
 
 
+def _number(value, cast=float):
+    return cast(value) if value not in (None, "") else None
+
+
 class RuleFormParser:
     async def __call__(self, request: Request):
         form_data = await request.form()
@@ -14,10 +20,25 @@ class RuleFormParser:
                 f for f in form_data.getlist(f"file_upload_{r_id}") if f.filename
             ]
             trig_up = form_data.get(f"trigger_file_upload_{r_id}")
+            try:
+                limits = TriggerLimits(
+                    cooldown=_number(form_data.get(f"cooldown_{r_id}")),
+                    global_cooldown=_number(form_data.get(f"global_cooldown_{r_id}")),
+                    per_minute=_number(form_data.get(f"per_minute_{r_id}")),
+                    burst=_number(form_data.get(f"burst_{r_id}"), int),
+                )
+            except ValueError as e:
+                # ValidationError também é ValueError; o resto são números inválidos.
+                reason = limits_error(e) if isinstance(e, ValidationError) else e
+                raise HTTPException(
+                    status_code=422,
+                    detail=f"Limites inválidos na regra "
+                    f"'{form_data.get(f'name_{r_id}')}': {reason}",
+                )
 
             rules.append(
                 TriggerRule(
-                    id=uuid4().hex[:8],
+                    id=uuid4().hex[:8] if r_id.startswith("new_") else r_id,
                     name=form_data.get(f"name_{r_id}"),
                     type=form_data.get(f"type_{r_id}"),
                     matcher=form_data.get(f"matcher_{r_id}") or "always",
@@ -26,6 +47,7 @@ class RuleFormParser:
                         pattern=form_data.get(f"pattern_{r_id}"),
                         hash=form_data.get(f"hash_{r_id}"),
                     ),
+                    limits=limits if limits.model_dump(exclude_none=True) else None,
                     action=form_data.get(f"action_{r_id}"),
                     value=form_data.get(f"value_{r_id}"),
                     existing_files=form_data.getlist(f"keep_files_{r_id}"),
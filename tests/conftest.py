@@ -0,0 +1,9 @@
+import os
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+# Valores mínimos para o Settings do kernel carregar sem um .env.
+os.environ.setdefault("EVOLUTION_URL", "http://localhost:8080")
+os.environ.setdefault("EVOLUTION_TOKEN", "test")
@@ -0,0 +1,25 @@
+import asyncio
+from unittest.mock import MagicMock
+
+from app.kernel import MessageData
+from app.kernel.core import ChatClient
+from app.kernel.core.interfaces.message import MessageType
+from app.modules.triggers.core.matchers.implementations import resolve_image_hash
+
+
+def test_undecodable_media_yields_no_hash():
+    msg = MessageData(
+        message_id="1",
+        name="",
+        number="5511999999999",
+        type=MessageType.IMAGE,
+        body="",
+        instance="test",
+        is_group=False,
+        mentioned=False,
+        client=MagicMock(spec=ChatClient),
+        media_key="bad-media",
+        cached_media=b"notimage",
+    )
+
+    assert asyncio.run(resolve_image_hash(msg)) is None
@@ -0,0 +1,24 @@
+import asyncio
+
+from app.kernel.core import ChatResponse
+from app.kernel.infrastructure.providers.evolution.outbound import OutboundScheduler
+
+
+def test_close_cancels_the_item_being_sent():
+    async def scenario():
+        scheduler = OutboundScheduler(rate=100, burst=5, coalesce_window_ms=0)
+
+        async def hang(instance, path, payload) -> ChatResponse:
+            await asyncio.sleep(10)
+
+        caller = asyncio.create_task(
+            scheduler.submit("bot", "5511", "sendText", {"text": "oi"}, hang)
+        )
+        await asyncio.sleep(0.01)
+        await scheduler.close(drain_timeout=0.01)
+
+        # O chamador não pode ficar esperando para sempre.
+        done, _ = await asyncio.wait([caller], timeout=1)
+        assert caller in done and caller.cancelled()
+
+    asyncio.run(scenario())
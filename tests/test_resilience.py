@@ -0,0 +1,87 @@
+import asyncio
+
+import httpx
+
+from app.kernel.infrastructure.network.base_http_client import (
+    BaseHttpClient,
+    breaker_for,
+)
+from app.kernel.core.registry import metrics_registry
+from app.kernel.infrastructure.network.resilience import CircuitBreaker
+
+
+class ProbeClient(BaseHttpClient):
+    pass
+
+
+def test_cancelled_half_open_probe_releases_the_circuit():
+    async def scenario():
+        client = ProbeClient(
+            base_url="http://probe.test",
+            breaker_threshold=1,
+            breaker_reset_timeout=0.0,
+            retry_attempts=1,
+        )
+        url = "http://probe.test/x"
+        breaker = breaker_for(url, 1, 0.0)
+
+        async def fail():
+            raise httpx.ConnectError("down")
+
+        async def hang():
+            await asyncio.sleep(10)
+
+        async def ok():
+            return "ok"
+
+        try:
+            await client._guarded(url, fail)
+        except httpx.ConnectError:
+            pass
+        assert breaker.state == CircuitBreaker.OPEN
+
+        # A sonda do half-open é cancelada antes de responder.
+        probe = asyncio.create_task(client._guarded(url, hang))
+        await asyncio.sleep(0)
+        assert breaker.state == CircuitBreaker.HALF_OPEN
+        probe.cancel()
+        await asyncio.gather(probe, return_exceptions=True)
+
+        # A próxima chamada vira a nova sonda e fecha o circuito.
+        assert await client._guarded(url, ok) == "ok"
+        assert breaker.state == CircuitBreaker.CLOSED
+
+    asyncio.run(scenario())
+
+
+def test_server_errors_open_the_circuit():
+    async def scenario():
+        client = ProbeClient(
+            base_url="http://broken.test", breaker_threshold=2, retry_attempts=1
+        )
+        url = "http://broken.test/x"
+        breaker = breaker_for(url, 2, 30.0)
+        request = httpx.Request("GET", url)
+
+        async def server_error():
+            response = httpx.Response(500, request=request)
+            raise httpx.HTTPStatusError("500", request=request, response=response)
+
+        for _ in range(2):
+            try:
+                await client._guarded(url, server_error)
+            except httpx.HTTPStatusError:
+                pass
+        assert breaker.state == CircuitBreaker.OPEN
+
+    asyncio.run(scenario())
+
+
+def test_each_client_instance_exports_its_limiter():
+    first = ProbeClient(base_url="http://a.test")
+    second = ProbeClient(base_url="http://b.test")
+
+    limiters = metrics_registry.snapshot()["http_limiters"]
+    assert "ProbeClient" in limiters
+    assert len([name for name in limiters if name.startswith("ProbeClient")]) >= 2
+    assert first._limiter is not second._limiter
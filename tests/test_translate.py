@@ -0,0 +1,26 @@
+import asyncio
+
+from app.kernel.infrastructure.services.translate import TranslateClient
+
+
+def test_cancelled_flush_resolves_pending_callers():
+    async def scenario():
+        client = TranslateClient.__new__(TranslateClient)
+
+        async def hang(group, texts):
+            await asyncio.sleep(10)
+
+        client._send = hang
+        loop = asyncio.get_running_loop()
+        batch = {"oi": loop.create_future(), "tchau": loop.create_future()}
+
+        flush = asyncio.create_task(client._flush(("auto", "pb", "text"), batch))
+        await asyncio.sleep(0)
+        flush.cancel()
+        await asyncio.gather(flush, return_exceptions=True)
+
+        # Sem resultado, `translate` devolve o texto original.
+        results = await asyncio.wait_for(asyncio.gather(*batch.values()), 1)
+        assert results == [None, None]
+
+    asyncio.run(scenario())
@@ -0,0 +1,26 @@
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.kernel.api.webhooks import evolution
+from app.kernel.core import module_registry
+
+
+class AcceptAll:
+    def accepts(self, message_type) -> bool:
+        return True
+
+
+def test_rejected_webhook_does_not_consume_the_message_id(monkeypatch):
+    monkeypatch.setattr(module_registry, "get_all", lambda: [AcceptAll()])
+    app = FastAPI()
+    app.include_router(evolution.router)
+    client = TestClient(app)
+
+    # `data.key.remoteJid` ausente: passa pelo pré-filtro, falha na validação.
+    payload = {
+        "event": "messages.upsert",
+        "instance": "bot",
+        "data": {"key": {"id": "retry-me"}, "messageType": "conversation"},
+    }
+    assert client.post("/evolution", json=payload).status_code == 422
+    assert client.post("/evolution", json=payload).status_code == 422